@@ -158,7 +158,7 @@ class NPCExtractionService:
                 "stage_flags": stage_flags,
             }
 
-        completed = state.completed_stages if state else [stage for stage, done in stage_flags.items() if done]
+        completed = [stage for stage, done in stage_flags.items() if done]
 
         return {
             "npc_id": npc_id,
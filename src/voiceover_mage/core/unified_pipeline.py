@@ -4,7 +4,7 @@
 import hashlib
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
 
 from voiceover_mage.core.models import NPCProfile
 from voiceover_mage.core.service import NPCExtractionService
@@ -15,8 +15,9 @@ from voiceover_mage.extraction.analysis.text import NPCTextCharacteristics
 from voiceover_mage.extraction.voice.elevenlabs import ElevenLabsVoicePromptGenerator
 from voiceover_mage.extraction.wiki.crawl4ai import Crawl4AINPCExtractor
 from voiceover_mage.persistence import NPCPipelineState
-from voiceover_mage.persistence.manager import DatabaseManager
-from voiceover_mage.services.voice.elevenlabs import ElevenLabsVoiceService
+from voiceover_mage.persistence.audio import store_audio
+from voiceover_mage.persistence.manager import STAGE_ORDER, DatabaseManager
+from voiceover_mage.services.voice import ElevenLabsVoiceService
 from voiceover_mage.utils.logging import get_logger
 from voiceover_mage.utils.retry import LLMAPIError, llm_retry
 
@@ -139,43 +140,41 @@ class UnifiedPipelineService:
             voice_description=description, sample_text=sample_text
         )
 
-        # audio_bytes is a tuple of bytes, we should iterate over each until it is exhausted
-        out_dir = Path("data/voice_previews")
-        out_dir.mkdir(parents=True, exist_ok=True)
-
+        # Clips go to content-addressed files; rows keep only the path so queries never drag audio along
         last_out_path: Path | None = None
+        previews: list[dict[str, Any]] = []
         for i, audio in enumerate(audio_clips):
-            out_path = out_dir / f"{state.id}_preview_{i + 1}.mp3"
-            with open(out_path, "wb") as f:
-                f.write(audio)
+            out_path = store_audio(audio)
             self.logger.info("Saved voice preview", npc_id=state.id, sample_path=str(out_path))
             last_out_path = out_path
 
-            # Persist to database as a voice sample
-            try:
-                await self.database.create_voice_preview(
-                    npc_id=state.id,
-                    voice_prompt=voice_description.get("description", ""),
-                    sample_text=voice_description.get("sample_text", ""),
-                    provider="elevenlabs",
-                    model="text_to_voice.design:eleven_ttv_v3",
-                    audio_path=str(out_path),
-                    audio_bytes=audio,
-                    is_representative=False,
-                    generation_metadata={
+            previews.append(
+                {
+                    "voice_prompt": description,
+                    "sample_text": sample_text,
+                    "provider": "elevenlabs",
+                    "model": "text_to_voice.design:eleven_ttv_v3",
+                    "audio_path": str(out_path),
+                    "is_representative": False,
+                    "generation_metadata": {
                         "model_id": "eleven_ttv_v3",
                         "preview_index": i + 1,
                         "total_previews": len(audio_clips),
                     },
-                )
-            except Exception as e:
-                self.logger.error(
-                    "Failed to persist voice sample",
-                    npc_id=state.id,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                    sample_index=i + 1,
-                )
+                }
+            )
+
+        # Persist every sample in one transaction rather than one commit per clip
+        try:
+            await self.database.create_voice_previews(state.id, previews)
+        except Exception as e:
+            self.logger.error(
+                "Failed to persist voice samples",
+                npc_id=state.id,
+                error=str(e),
+                error_type=type(e).__name__,
+                samples=len(previews),
+            )
         # Mark voice generation stage complete
         updated_state = await self.database.get_cached_extraction(state.id)
         if updated_state:
@@ -205,7 +204,8 @@ class UnifiedPipelineService:
             extractor = Crawl4AINPCExtractor(api_key=self.api_key)
             wiki_data = await extractor.extract_npc_data(state.id)
 
-            checksum = hashlib.sha256(wiki_data.model_dump_json().encode()).hexdigest()
+            # Hash the serializer's bytes directly; model_dump_json() would build a str only to encode it again.
+            checksum = hashlib.sha256(wiki_data.__pydantic_serializer__.to_json(wiki_data)).hexdigest()
 
             await self.database.upsert_wiki_snapshot(
                 npc_id=state.id,
@@ -322,17 +322,18 @@ class UnifiedPipelineService:
         if not extraction:
             return {"npc_id": id, "exists": False, "completed_stages": [], "has_character_profile": False}
 
+        stage_flags = extraction.stage_flags
         return {
             "npc_id": id,
             "exists": True,
             "npc_name": extraction.npc_name,
-            "completed_stages": extraction.completed_stages,
+            "completed_stages": [stage for stage in STAGE_ORDER if stage_flags[stage]],
             "has_raw_data": bool(extraction.raw_data),
             "has_text_analysis": bool(extraction.text_analysis),
             "has_visual_analysis": bool(extraction.visual_analysis),
             "has_character_profile": bool(extraction.character_profile),
-            "stage_flags": extraction.stage_flags,
-            "is_complete": "complete" in extraction.completed_stages,
+            "stage_flags": stage_flags,
+            "is_complete": stage_flags["complete"],
         }
 
     async def close(self) -> None:
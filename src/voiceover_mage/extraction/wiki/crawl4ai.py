@@ -55,7 +55,7 @@ class Crawl4AINPCExtractor(BaseWikiNPCExtractor):
         return npc_list[0]  # Return the first NPC found
 
     @llm_retry(max_attempts=3, min_wait=2.0, max_wait=30.0, with_rate_limiting=True, with_circuit_breaker=True)
-    @log_api_call("crawl4ai")
+    @log_api_call("crawl4ai", url_arg=1)
     @log_extraction_step("extract_npc_data_from_url")
     async def _extract_npc_data_from_url(self, url: str) -> list[NPCWikiSourcedData]:
         """Extract NPC data from the given URL using crawl4ai."""
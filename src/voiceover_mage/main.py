@@ -157,9 +157,7 @@ async def _pipeline_async(npc_id: int, save_output: bool, json_output: bool):
 
             db = DatabaseManager()
             await db.create_tables()
-            cached = await db.get_cached_extraction(npc_id)
-            if cached and cached.npc_name:
-                npc_name = cached.npc_name
+            npc_name = await db.get_npc_name(npc_id) or npc_name
         except Exception:
             pass  # Fallback to Unknown NPC
 
@@ -0,0 +1,27 @@
+# ABOUTME: Content-addressed storage for generated audio files
+# ABOUTME: Keeps audio blobs on disk so database rows only carry a path
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+AUDIO_DIR = Path("data/voice_previews")
+
+
+def store_audio(audio: bytes, directory: Path = AUDIO_DIR, suffix: str = ".mp3") -> Path:
+    """Write audio under its SHA-256 digest and return the path.
+
+    Identical clips map to the same file, so re-running a stage never duplicates
+    audio on disk. The file is written to a temporary name and renamed into place
+    so readers never see a partial clip.
+    """
+    path = directory / f"{hashlib.sha256(audio).hexdigest()}{suffix}"
+    if path.exists():
+        return path
+
+    directory.mkdir(parents=True, exist_ok=True)
+    partial = path.with_suffix(f"{suffix}.part")
+    partial.write_bytes(audio)
+    partial.replace(path)
+    return path
@@ -3,18 +3,33 @@
 
 from __future__ import annotations
 
+from functools import cache
 from typing import Any
 
 from pydantic import TypeAdapter
 from sqlalchemy import JSON, TypeDecorator
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeEngine
+
+
+@cache
+def _type_adapter(pydantic_type: Any) -> TypeAdapter[Any]:
+    """Build each TypeAdapter once; its core schema is the expensive part."""
+    return TypeAdapter(pydantic_type)
+
+
+def json_column() -> TypeEngine[Any]:
+    """Plain JSON column type that is stored as JSONB on PostgreSQL."""
+    return JSON().with_variant(JSONB(), "postgresql")
 
 
 class PydanticJson(TypeDecorator[Any]):
     """
     A SQLAlchemy TypeDecorator that uses Pydantic's TypeAdapter for JSON serialization
     and deserialization. This allows for complex Pydantic models to be stored in JSON
-    columns with automatic validation and conversion.
+    columns with automatic validation and conversion. On PostgreSQL the column is
+    stored as JSONB.
 
     See: https://github.com/fastapi/sqlmodel/issues/63#issuecomment-2727480036
     """
@@ -24,19 +39,48 @@ class PydanticJson(TypeDecorator[Any]):
 
     def __init__(self, pydantic_type: type) -> None:
         super().__init__(self.impl)
-        self.type_adapter = TypeAdapter(pydantic_type)
+        self.type_adapter = _type_adapter(pydantic_type)
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(JSONB())
+        return dialect.type_descriptor(JSON())
 
     def coerce_compared_value(self, op: Any, value: Any) -> Any:
         return self.impl.coerce_compared_value(op, value)  # type: ignore[misc]
 
     def bind_processor(self, dialect: Dialect) -> Any:
-        def process(value: Any) -> bytes | None:
-            return self.type_adapter.dump_json(value) if value is not None else None
+        if dialect.name == "postgresql":
+            # PostgreSQL drivers bind jsonb parameters as text, not bytes.
+            def process_text(value: Any, _dump: Any = self.type_adapter.dump_json) -> str | None:
+                return _dump(value).decode() if value is not None else None
+
+            return process_text
+
+        # Bind the adapter method as a default argument so each row is a LOAD_FAST,
+        # not a closure read of ``self`` followed by two attribute lookups.
+        def process(value: Any, _dump: Any = self.type_adapter.dump_json) -> bytes | None:
+            return _dump(value) if value is not None else None
 
         return process
 
     def result_processor(self, dialect: Dialect, coltype: Any) -> Any:
-        def process(value: Any) -> Any:
-            return self.type_adapter.validate_json(value) if value is not None else None
+        if dialect.name == "postgresql":
+            # Some drivers (psycopg) decode jsonb to Python objects before we see it.
+            def process_decoded(
+                value: Any,
+                _validate_json: Any = self.type_adapter.validate_json,
+                _validate_python: Any = self.type_adapter.validate_python,
+            ) -> Any:
+                if value is None:
+                    return None
+                if isinstance(value, str | bytes):
+                    return _validate_json(value)
+                return _validate_python(value)
+
+            return process_decoded
+
+        def process(value: Any, _validate: Any = self.type_adapter.validate_json) -> Any:
+            return _validate(value) if value is not None else None
 
         return process
@@ -3,15 +3,23 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator, Awaitable, Callable
+from collections import Counter
+from collections.abc import AsyncGenerator, Awaitable, Callable, Mapping, Sequence
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from functools import wraps
 from typing import Any, ParamSpec
 
-from sqlalchemy import delete, desc, select, update
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from pydantic_core import from_json, to_json
+from sqlalchemy import bindparam, delete, desc, event, func, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import undefer
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.schema import CreateIndex
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -36,6 +44,176 @@ def with_session[T](func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitabl
     return wrapper
 
 
+def with_read_session[T](func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """Decorator that injects an autocommit session for read-only queries.
+
+    Readers never open an explicit transaction, so with SQLite they cannot hold
+    locks that would block a concurrent writer.
+    """
+
+    @wraps(func)
+    async def wrapper(self: DatabaseManager, *args: Any, **kwargs: Any) -> T:
+        async with self.async_session(bind=self.read_engine) as session:
+            return await func(self, session, *args, **kwargs)
+
+    return wrapper
+
+
+# Applied to every new SQLite connection. WAL with synchronous=NORMAL keeps the
+# database consistent after a crash but may lose the last few committed
+# transactions if the machine loses power; that is acceptable for a cache of
+# regenerable pipeline artifacts.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Connection event hook that tunes SQLite for the commit-heavy pipeline workload."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _engine_options(database_url: str) -> dict[str, Any]:
+    """Pool settings for the given URL; file-backed SQLite keeps a warm pool of connections."""
+    url = make_url(database_url)
+    if url.get_backend_name() != "sqlite":
+        return {}
+    # A local SQLite file cannot go stale like a network connection; skip the ping.
+    options: dict[str, Any] = {"pool_pre_ping": False}
+    if url.database and url.database != ":memory:":
+        options.update(
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=5,
+            max_overflow=10,
+            pool_recycle=-1,
+        )
+    return options
+
+
+def _json_serializer(value: Any) -> str:
+    """Encode plain JSON columns with pydantic-core, matching how PydanticJson columns are written."""
+    return to_json(value).decode()
+
+
+def _create_engine(database_url: str) -> AsyncEngine:
+    """Build an engine with the JSON codecs and SQLite tuning every manager expects."""
+    engine = create_async_engine(
+        database_url,
+        echo=False,
+        json_serializer=_json_serializer,
+        json_deserializer=from_json,
+        **_engine_options(database_url),
+    )
+    if engine.dialect.name == "sqlite":
+        event.listen(engine.sync_engine, "connect", _apply_sqlite_pragmas)
+    return engine
+
+
+# Process-wide engines keyed by URL, and how many open DatabaseManagers use each
+_engines: dict[str, AsyncEngine] = {}
+_engine_users: Counter[str] = Counter()
+
+
+def _acquire_engine(database_url: str) -> AsyncEngine:
+    """Return the shared engine for a URL so every DatabaseManager shares one pool."""
+    engine = _engines.get(database_url)
+    if engine is None:
+        engine = _engines[database_url] = _create_engine(database_url)
+    _engine_users[database_url] += 1
+    return engine
+
+
+async def _release_engine(database_url: str, engine: AsyncEngine) -> None:
+    """Drop one user of a shared engine; the last user disposes it."""
+    if _engines.get(database_url) is not engine:
+        return  # Already forgotten by reset_engines, which disposed it
+    _engine_users[database_url] -= 1
+    if _engine_users[database_url] <= 0:
+        del _engines[database_url]
+        del _engine_users[database_url]
+        await engine.dispose()
+
+
+async def reset_engines() -> None:
+    """Dispose and forget every shared engine so the next DatabaseManager builds a fresh one (for tests)."""
+    engines = list(_engines.values())
+    _engines.clear()
+    _engine_users.clear()
+    for engine in engines:
+        await engine.dispose()
+
+
+# Dialects whose CREATE INDEX accepts IF NOT EXISTS
+_IF_NOT_EXISTS_INDEX_DIALECTS = frozenset({"sqlite", "postgresql"})
+
+
+def _create_schema(connection: Connection) -> None:
+    """Create missing tables, then any declared index an existing table lacks.
+
+    ``create_all`` only builds indexes together with a new table, so an index added to a
+    model later would never reach databases created before it. Dialects without
+    ``CREATE INDEX IF NOT EXISTS`` inspect the table for each index instead.
+    """
+    SQLModel.metadata.create_all(connection)
+    if_not_exists = connection.dialect.name in _IF_NOT_EXISTS_INDEX_DIALECTS
+    for table in SQLModel.metadata.tables.values():
+        for index in table.indexes:
+            if if_not_exists:
+                connection.execute(CreateIndex(index, if_not_exists=True))
+            else:
+                index.create(connection, checkfirst=True)
+
+
+# INSERT constructs that support ON CONFLICT DO UPDATE, by dialect name
+_UPSERT_INSERTS = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
+
+
+def _character_profile_upsert(dialect_name: str, values: Mapping[str, Any]) -> Any:
+    """Build the single-statement UPSERT for a character profile, returning the stored row."""
+    try:
+        insert_for_dialect = _UPSERT_INSERTS[dialect_name]
+    except KeyError:
+        raise NotImplementedError(f"Character profile UPSERT is not supported on {dialect_name}") from None
+    statement = insert_for_dialect(CharacterProfile).values(**values)
+    return statement.on_conflict_do_update(
+        index_elements=[CharacterProfile.npc_id],
+        set_={key: statement.excluded[key] for key in values if key != "npc_id"},
+    ).returning(CharacterProfile)
+
+
+# Per-NPC queries built once at import. Each call only binds ``npc_id``, so the
+# expression tree is not rebuilt and the engine's compiled cache hits every time.
+_NPC_ID = bindparam("npc_id")
+_PREVIEW_ORDER = (desc(VoicePreview.created_at), desc(VoicePreview.id))
+
+# VoicePreview.audio_bytes is deferred on the mapper; only the full listing loads it.
+_SELECT_PREVIEWS_WITHOUT_AUDIO = select(VoicePreview).where(VoicePreview.npc_id == _NPC_ID).order_by(*_PREVIEW_ORDER)
+_SELECT_PREVIEWS = _SELECT_PREVIEWS_WITHOUT_AUDIO.options(undefer(VoicePreview.audio_bytes))  # type: ignore[arg-type]
+_SELECT_TRANSCRIPTS = select(AudioTranscript).where(AudioTranscript.npc_id == _NPC_ID)
+_SELECT_SELECTED_PREVIEW_ID = select(NPC.selected_preview_id).where(NPC.id == _NPC_ID)
+_SELECT_NPC_NAME = select(NPC.name).where(NPC.id == _NPC_ID)
+_SELECT_WIKI_DONE = select(func.length(WikiSnapshot.raw_markdown) > 0).where(WikiSnapshot.npc_id == _NPC_ID)
+_SELECT_PROFILE_DONE = select(CharacterProfile.profile_json.is_not(None)).where(  # type: ignore[union-attr]
+    CharacterProfile.npc_id == _NPC_ID
+)
+_SELECT_PREVIEW_FLAGS = (
+    select(VoicePreview.id, VoicePreview.is_representative)  # type: ignore[call-overload]
+    .where(VoicePreview.npc_id == _NPC_ID)
+    .order_by(*_PREVIEW_ORDER)
+)
+_SELECT_TRANSCRIBED_PREVIEW_IDS = select(AudioTranscript.preview_id).where(AudioTranscript.npc_id == _NPC_ID)
+
+
 STAGE_ORDER = [
     "wiki_data",
     "character_profile",
@@ -46,6 +224,27 @@ STAGE_ORDER = [
 ]
 
 
+def _build_stage_flags(
+    *,
+    wiki_done: bool,
+    profile_done: bool,
+    voice_generated: bool,
+    selection_done: bool,
+    transcription_done: bool,
+) -> dict[str, bool]:
+    """Combine per-table completion checks into the ordered stage flag map."""
+    complete = wiki_done and profile_done and voice_generated and selection_done
+
+    return {
+        "wiki_data": wiki_done,
+        "character_profile": profile_done,
+        "voice_generation": voice_generated,
+        "voice_selection": selection_done,
+        "transcription": transcription_done,
+        "complete": complete and transcription_done,
+    }
+
+
 @dataclass(slots=True)
 class NPCPipelineState:
     """Aggregated NPC pipeline state assembled from normalized tables."""
@@ -142,7 +341,7 @@ class NPCPipelineState:
         return self.character_profile_entry.pipeline_version
 
     @property
-    def profile_updated_at(self):
+    def profile_updated_at(self) -> datetime | None:
         if not self.character_profile_entry:
             return None
         return self.character_profile_entry.updated_at
@@ -182,22 +381,17 @@ class NPCPipelineState:
     # --- Stage computation -----------------------------------------------------------
     @property
     def stage_flags(self) -> dict[str, bool]:
-        wiki_done = bool(self.wiki_snapshot and self.wiki_snapshot.raw_markdown)
-        profile_done = bool(self.character_profile)
-        voice_generated = bool(self.voice_previews)
-        selection_done = self.selected_preview is not None
-        transcription_done = bool(self.transcripts_for_selected_preview)
-
-        complete = wiki_done and profile_done and voice_generated and selection_done
-
-        return {
-            "wiki_data": wiki_done,
-            "character_profile": profile_done,
-            "voice_generation": voice_generated,
-            "voice_selection": selection_done,
-            "transcription": transcription_done,
-            "complete": complete and transcription_done,
-        }
+        # Resolve the selected preview once; it scans the preview list.
+        selected = self.selected_preview
+        selected_id = selected.id if selected is not None else None
+        return _build_stage_flags(
+            wiki_done=bool(self.raw_markdown),
+            profile_done=bool(self.character_profile),
+            voice_generated=bool(self.voice_previews),
+            selection_done=selected is not None,
+            transcription_done=selected_id is not None
+            and any(t.preview_id == selected_id for t in self.audio_transcripts),
+        )
 
     @property
     def completed_stages(self) -> list[str]:
@@ -220,10 +414,14 @@ class NPCPipelineState:
 class DatabaseManager:
     """Manages async database operations for normalized NPC data."""
 
-    def __init__(self, database_url: str = "sqlite+aiosqlite:///./data/voiceover_mage.db"):
+    def __init__(self, database_url: str = "sqlite+aiosqlite:///./data/voiceover_mage.db") -> None:
         self.database_url = database_url
         self.logger = get_logger(__name__)
-        self.engine = create_async_engine(database_url, echo=False)
+        self.engine = _acquire_engine(database_url)
+        # The shared engine this manager holds a reference on until close()
+        self._shared_engine: AsyncEngine | None = self.engine
+        # Autocommit view of the same pool for with_read_session, built once per manager
+        self.read_engine = self.engine.execution_options(isolation_level="AUTOCOMMIT")
         self.async_session = async_sessionmaker(
             self.engine,
             class_=AsyncSession,
@@ -232,7 +430,7 @@ class DatabaseManager:
 
     async def create_tables(self) -> None:
         async with self.engine.begin() as conn:
-            await conn.run_sync(SQLModel.metadata.create_all)
+            await conn.run_sync(_create_schema)
 
     @with_session
     async def ensure_npc(
@@ -257,14 +455,15 @@ class DatabaseManager:
             if npc.wiki_url != wiki_url:
                 npc.wiki_url = wiki_url
                 changed = True
-            if changed:
-                npc.updated_at = utcnow()
-                session.add(npc)
+            if not changed:
+                # Nothing to write; skip the commit round trip entirely.
+                return npc
+            npc.updated_at = utcnow()
+            session.add(npc)
         else:
             npc = NPC(id=npc_id, name=name, variant=variant, wiki_url=wiki_url)
             session.add(npc)
         await session.commit()
-        await session.refresh(npc)
         return npc
 
     async def upsert_wiki_snapshot(
@@ -280,10 +479,19 @@ class DatabaseManager:
         extraction_success: bool = True,
         error_message: str | None = None,
     ) -> WikiSnapshot:
-        """Insert or update the wiki snapshot for an NPC."""
+        """Insert or update the wiki snapshot for an NPC.
+
+        When the stored snapshot already has the same non-empty checksum, only
+        ``fetched_at`` is refreshed so unchanged markdown and JSON are not rewritten.
+        """
         timestamp = fetched_at or utcnow()
         async with self.async_session() as session:
             snapshot = await session.get(WikiSnapshot, npc_id)
+            if snapshot and source_checksum is not None and snapshot.source_checksum == source_checksum:
+                snapshot.fetched_at = timestamp
+                session.add(snapshot)
+                await session.commit()
+                return snapshot
             if snapshot:
                 snapshot.raw_markdown = raw_markdown
                 snapshot.chathead_image_url = chathead_image_url
@@ -311,7 +519,6 @@ class DatabaseManager:
                 npc.updated_at = utcnow()
                 session.add(npc)
             await session.commit()
-            await session.refresh(snapshot)
             return snapshot
 
     async def upsert_character_profile(
@@ -323,33 +530,22 @@ class DatabaseManager:
         visual_analysis: NPCVisualCharacteristics | None = None,
         pipeline_version: str | None = None,
     ) -> CharacterProfile:
-        """Insert or update the character profile for an NPC."""
+        """Insert or update the character profile for an NPC with a single UPSERT."""
         timestamp = utcnow()
+        values: dict[str, Any] = {
+            "npc_id": npc_id,
+            "profile_json": profile,
+            "text_analysis_json": text_analysis,
+            "visual_analysis_json": visual_analysis,
+            "pipeline_version": pipeline_version,
+            "updated_at": timestamp,
+        }
+        statement = _character_profile_upsert(self.engine.dialect.name, values)
         async with self.async_session() as session:
-            profile_row = await session.get(CharacterProfile, npc_id)
-            if profile_row:
-                profile_row.profile_json = profile
-                profile_row.text_analysis_json = text_analysis
-                profile_row.visual_analysis_json = visual_analysis
-                profile_row.pipeline_version = pipeline_version
-                profile_row.updated_at = timestamp
-            else:
-                profile_row = CharacterProfile(
-                    npc_id=npc_id,
-                    profile_json=profile,
-                    text_analysis_json=text_analysis,
-                    visual_analysis_json=visual_analysis,
-                    pipeline_version=pipeline_version,
-                    updated_at=timestamp,
-                )
-            session.add(profile_row)
-            npc = await session.get(NPC, npc_id)
-            if npc:
-                npc.updated_at = timestamp
-                session.add(npc)
+            stored = (await session.scalars(statement, execution_options={"populate_existing": True})).one()
+            await session.exec(update(NPC).where(NPC.id == npc_id).values(updated_at=timestamp))  # type: ignore[arg-type]
             await session.commit()
-            await session.refresh(profile_row)
-            return profile_row
+        return stored
 
     async def create_voice_preview(
         self,
@@ -364,8 +560,8 @@ class DatabaseManager:
         audio_bytes: bytes | None = None,
         is_representative: bool = False,
     ) -> VoicePreview:
-        """Persist a generated voice preview."""
-        async with self.async_session() as session:
+        """Persist a generated voice preview and, if representative, select it in one transaction."""
+        async with self.session() as session:
             if is_representative:
                 await session.exec(
                     update(VoicePreview).where(VoicePreview.npc_id == npc_id).values(is_representative=False)  # type: ignore[arg-type]
@@ -382,8 +578,8 @@ class DatabaseManager:
                 is_representative=is_representative,
             )
             session.add(preview)
-            await session.commit()
-            await session.refresh(preview)
+            # Flushing assigns the primary key; a refresh would only read the audio blob back.
+            await session.flush()
 
             if is_representative and preview.id is not None:
                 npc = await session.get(NPC, npc_id)
@@ -391,41 +587,91 @@ class DatabaseManager:
                     npc.selected_preview_id = preview.id
                     npc.updated_at = utcnow()
                     session.add(npc)
-                    await session.commit()
 
-            return preview
+        return preview
+
+    async def create_voice_previews(self, npc_id: int, previews: Sequence[Mapping[str, Any]]) -> list[VoicePreview]:
+        """Persist several generated voice previews for one NPC in a single transaction.
+
+        Each mapping takes the keyword arguments of ``create_voice_preview`` (minus ``npc_id``).
+        The rows go out as one batched INSERT ... RETURNING and the database syncs once. If any
+        preview is representative, the last one wins.
+        """
+        if not previews:
+            return []
+
+        created_at = utcnow()
+        rows = [
+            {
+                "npc_id": npc_id,
+                "voice_prompt": values["voice_prompt"],
+                "sample_text": values["sample_text"],
+                "provider": values["provider"],
+                "model": values["model"],
+                "generation_metadata": values.get("generation_metadata") or {},
+                "audio_path": values.get("audio_path"),
+                "audio_bytes": values.get("audio_bytes"),
+                "is_representative": False,
+                "created_at": created_at,
+            }
+            for values in previews
+        ]
+        representative_index = next(
+            (index for index in reversed(range(len(previews))) if previews[index].get("is_representative")),
+            None,
+        )
+        if representative_index is not None:
+            rows[representative_index]["is_representative"] = True
+
+        async with self.session() as session:
+            if representative_index is not None:
+                await session.exec(
+                    update(VoicePreview).where(VoicePreview.npc_id == npc_id).values(is_representative=False)  # type: ignore[arg-type]
+                )
+            ids = await VoicePreview.bulk_insert(session, rows)
+            if representative_index is not None:
+                await session.exec(
+                    update(NPC)
+                    .where(NPC.id == npc_id)  # type: ignore[arg-type]
+                    .values(selected_preview_id=ids[representative_index], updated_at=utcnow())
+                )
+
+        return [VoicePreview(id=preview_id, **row) for preview_id, row in zip(ids, rows, strict=True)]
 
     async def set_selected_voice_preview(self, npc_id: int, preview_id: int) -> VoicePreview | None:
-        """Mark a voice preview as the selected representative for the NPC."""
+        """Mark a voice preview as the selected representative for the NPC.
+
+        The returned preview is detached without its deferred ``audio_bytes``, so that
+        attribute cannot be read from it; use ``list_voice_previews`` when the audio itself
+        is needed.
+        """
         async with self.async_session() as session:
-            preview = await session.get(VoicePreview, preview_id)
-            if not preview or preview.npc_id != npc_id:
+            # Existence check on indexed keys only, so the audio blob is never read.
+            exists = await session.scalar(
+                select(func.count())
+                .select_from(VoicePreview)
+                .where(VoicePreview.id == preview_id, VoicePreview.npc_id == npc_id)  # type: ignore[arg-type]
+            )
+            if not exists:
                 return None
 
+            # Demote and promote in one pass.
             await session.exec(
-                update(VoicePreview).where(VoicePreview.npc_id == npc_id).values(is_representative=False)  # type: ignore[arg-type]
+                update(VoicePreview)  # type: ignore[arg-type]
+                .where(VoicePreview.npc_id == npc_id)
+                .values(is_representative=VoicePreview.id == preview_id)
             )
-
-            preview.is_representative = True
-            session.add(preview)
-
-            npc = await session.get(NPC, npc_id)
-            if npc:
-                npc.selected_preview_id = preview.id
-                npc.updated_at = utcnow()
-                session.add(npc)
-
+            await session.exec(
+                update(NPC).where(NPC.id == npc_id).values(selected_preview_id=preview_id, updated_at=utcnow())  # type: ignore[arg-type]
+            )
+            preview = await session.get(VoicePreview, preview_id)
             await session.commit()
-            await session.refresh(preview)
             return preview
 
-    @with_session
+    @with_read_session
     async def list_voice_previews(self, session: AsyncSession, npc_id: int) -> list[VoicePreview]:
         """Return all voice previews for an NPC, newest first."""
-        statement = (
-            select(VoicePreview).where(VoicePreview.npc_id == npc_id).order_by(desc(VoicePreview.created_at))  # type: ignore[arg-type]
-        )
-        result = await session.exec(statement)  # type: ignore[arg-type]
+        result = await session.exec(_SELECT_PREVIEWS, params={"npc_id": npc_id})  # type: ignore[arg-type]
         return list(result.scalars().all())
 
     async def save_audio_transcript(
@@ -448,12 +694,15 @@ class DatabaseManager:
             )
             session.add(transcript)
             await session.commit()
-            await session.refresh(transcript)
             return transcript
 
-    @with_session
+    @with_read_session
     async def get_cached_extraction(self, session: AsyncSession, npc_id: int) -> NPCPipelineState | None:
-        """Assemble the aggregated pipeline state for an NPC."""
+        """Assemble the aggregated pipeline state for an NPC.
+
+        Preview audio is not loaded: ``audio_bytes`` stays deferred on the returned previews
+        and cannot be read from them. Use ``list_voice_previews`` for the audio.
+        """
         npc = await session.get(NPC, npc_id)
         if not npc:
             return None
@@ -461,12 +710,10 @@ class DatabaseManager:
         snapshot = await session.get(WikiSnapshot, npc_id)
         profile_row = await session.get(CharacterProfile, npc_id)
 
-        previews_result = await session.exec(
-            select(VoicePreview).where(VoicePreview.npc_id == npc_id).order_by(desc(VoicePreview.created_at))  # type: ignore[arg-type]
-        )
+        previews_result = await session.exec(_SELECT_PREVIEWS_WITHOUT_AUDIO, params={"npc_id": npc_id})  # type: ignore[arg-type]
         previews = list(previews_result.scalars().all())
 
-        transcripts_result = await session.exec(select(AudioTranscript).where(AudioTranscript.npc_id == npc_id))  # type: ignore[arg-type]
+        transcripts_result = await session.exec(_SELECT_TRANSCRIPTS, params={"npc_id": npc_id})  # type: ignore[arg-type]
         transcripts = list(transcripts_result.scalars().all())
 
         return NPCPipelineState(
@@ -485,27 +732,70 @@ class DatabaseManager:
         """Set a voice sample as the representative for an NPC. Alias for set_selected_voice_preview."""
         return await self.set_selected_voice_preview(npc_id, sample_id)
 
-    async def compute_stage_map(self, npc_id: int) -> dict[str, bool]:
-        """Return derived stage flags for the NPC."""
-        state = await self.get_cached_extraction(npc_id)
-        if not state:
+    @with_read_session
+    async def get_npc_name(self, session: AsyncSession, npc_id: int) -> str | None:
+        """Return just the NPC's name, without assembling the full pipeline state."""
+        return await session.scalar(_SELECT_NPC_NAME, {"npc_id": npc_id})
+
+    @with_read_session
+    async def compute_stage_map(self, session: AsyncSession, npc_id: int) -> dict[str, bool]:
+        """Return derived stage flags for the NPC.
+
+        Only keys and flags are selected, so no JSON column or audio blob is decoded.
+        """
+        params = {"npc_id": npc_id}
+        npc_result = await session.exec(_SELECT_SELECTED_PREVIEW_ID, params=params)
+        npc_row = npc_result.first()
+        if npc_row is None:
             return {stage: False for stage in STAGE_ORDER}
-        return state.stage_flags
+        selected_preview_id = npc_row[0]
+
+        wiki_done = await session.scalar(_SELECT_WIKI_DONE, params)
+        profile_done = await session.scalar(_SELECT_PROFILE_DONE, params)
+        previews_result = await session.exec(_SELECT_PREVIEW_FLAGS, params=params)
+        previews = previews_result.all()
+        transcripts_result = await session.exec(_SELECT_TRANSCRIBED_PREVIEW_IDS, params=params)
+        transcribed_preview_ids = set(transcripts_result.scalars().all())
+
+        # Mirror NPCPipelineState.selected_preview: explicit selection first, then representative flag.
+        preview_ids = [preview_id for preview_id, _ in previews]
+        selected: int | None = None
+        if selected_preview_id is not None and selected_preview_id in preview_ids:
+            selected = selected_preview_id
+        else:
+            selected = next((preview_id for preview_id, representative in previews if representative), None)
+
+        return _build_stage_flags(
+            wiki_done=bool(wiki_done),
+            profile_done=bool(profile_done),
+            voice_generated=bool(previews),
+            selection_done=selected is not None,
+            transcription_done=selected is not None and selected in transcribed_preview_ids,
+        )
 
-    @with_session
-    async def clear_cache(self, session: AsyncSession) -> None:
-        """Remove all cached NPC pipeline data."""
-        # For bulk operations, we use the underlying SQLAlchemy execute method
-        # This is the correct approach for DELETE statements in SQLModel
-        await session.exec(delete(AudioTranscript))
-        await session.exec(delete(VoicePreview))
-        await session.exec(delete(CharacterProfile))
-        await session.exec(delete(WikiSnapshot))
-        await session.exec(delete(NPC))
-        await session.commit()
+    async def clear_cache(self) -> None:
+        """Remove all cached NPC pipeline data in one transaction."""
+        async with self.engine.begin() as conn:
+            for table in (AudioTranscript, VoicePreview, CharacterProfile, WikiSnapshot, NPC):
+                # An unqualified DELETE lets SQLite use its truncate optimization.
+                await conn.execute(delete(table))
+        if self.engine.dialect.name == "sqlite":
+            async with self.engine.connect() as conn:
+                # Fold the deletes into the main file and shrink the WAL back to zero bytes.
+                await conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
 
     async def close(self) -> None:
-        await self.engine.dispose()
+        """Release this manager's hold on the shared engine; the last manager to close disposes it.
+
+        An engine assigned to ``self.engine`` directly, as tests do, is not shared and is
+        disposed outright. Closing twice is a no-op.
+        """
+        shared, self._shared_engine = self._shared_engine, None
+        if shared is None:
+            return
+        await _release_engine(self.database_url, shared)
+        if self.engine is not shared:
+            await self.engine.dispose()
 
     @asynccontextmanager
     async def session(self) -> AsyncGenerator[AsyncSession]:
@@ -3,17 +3,20 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import LargeBinary
-from sqlmodel import JSON, Column, Field, SQLModel
+from sqlalchemy import DateTime, Index, LargeBinary, func, insert
+from sqlalchemy.orm import deferred
+from sqlmodel import Column, Field, SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from voiceover_mage.core.models import NPCWikiSourcedData
 from voiceover_mage.extraction.analysis.image import NPCVisualCharacteristics
 from voiceover_mage.extraction.analysis.synthesizer import NPCDetails
 from voiceover_mage.extraction.analysis.text import NPCTextCharacteristics
-from voiceover_mage.persistence.json_types import PydanticJson
+from voiceover_mage.persistence.json_types import PydanticJson, json_column
 
 
 def utcnow() -> datetime:
@@ -22,6 +25,24 @@ def utcnow() -> datetime:
     return datetime.now(UTC)
 
 
+class BulkInsertMixin:
+    """Adds a batched insert for tables that receive many rows per NPC."""
+
+    @classmethod
+    async def bulk_insert(cls, session: AsyncSession, rows: Sequence[Mapping[str, Any]]) -> list[int]:
+        """Insert ``rows`` as one executemany INSERT ... RETURNING and return their ids in row order.
+
+        Every mapping should carry the same keys; the caller commits. ``created_at`` may be left
+        out: the column default stamps it, which also works on tables created without the
+        server-side default.
+        """
+        if not rows:
+            return []
+        statement = insert(cls).returning(cls.id, sort_by_parameter_order=True)  # type: ignore[attr-defined]
+        result = await session.exec(statement, params=list(rows))
+        return list(result.scalars())
+
+
 class NPC(SQLModel, table=True):
     """Persistent identity for an NPC."""
 
@@ -54,7 +75,7 @@ class WikiSnapshot(SQLModel, table=True):
         sa_column=Column(PydanticJson(NPCWikiSourcedData)),
         description="Structured raw data extracted from the wiki",
     )
-    source_checksum: str | None = Field(default=None, description="Checksum of the source content")
+    source_checksum: str | None = Field(default=None, index=True, description="Checksum of the source content")
     fetched_at: datetime = Field(default_factory=utcnow, description="Timestamp when the snapshot was fetched")
     extraction_success: bool = Field(default=True, description="Whether the snapshot extraction succeeded")
     error_message: str | None = Field(default=None, description="Error message if extraction failed")
@@ -85,45 +106,68 @@ class CharacterProfile(SQLModel, table=True):
     updated_at: datetime = Field(default_factory=utcnow, description="Timestamp of the latest profile update")
 
 
-class VoicePreview(SQLModel, table=True):
+# Inline preview audio can run to megabytes, so the column is deferred: queries leave it
+# out unless they ask for it with ``undefer``.
+_AUDIO_BYTES_COLUMN = Column("audio_bytes", LargeBinary)
+
+
+class VoicePreview(BulkInsertMixin, SQLModel, table=True):
     """Generated voice preview for an NPC."""
 
     __tablename__ = "voice_preview"  # type: ignore[assignment]
+    __mapper_args__ = {"properties": {"audio_bytes": deferred(_AUDIO_BYTES_COLUMN)}}
+    __table_args__ = (
+        # Both lead with npc_id, so they also serve plain npc_id lookups.
+        Index("ix_voice_preview_npc_rep", "npc_id", "is_representative"),
+        Index("ix_voice_preview_npc_created", "npc_id", "created_at"),
+    )
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key for the voice preview")
-    npc_id: int = Field(index=True, foreign_key="npc.id", description="FK to npc.id")
+    npc_id: int = Field(foreign_key="npc.id", description="FK to npc.id")
     voice_prompt: str = Field(description="Prompt used to generate the voice preview")
     sample_text: str = Field(description="Sample text spoken in the preview")
     provider: str = Field(description="Voice generation provider")
     model: str = Field(description="Provider model or generator identifier")
     generation_metadata: dict[str, Any] = Field(
         default_factory=dict,
-        sa_column=Column(JSON),
+        sa_column=Column(json_column()),
         description="Provider-specific metadata for the generation",
     )
     audio_path: str | None = Field(default=None, description="Filesystem path to the generated audio preview")
     audio_bytes: bytes | None = Field(
         default=None,
-        sa_column=Column(LargeBinary),
-        description="Raw audio bytes for the preview (if stored inline)",
+        sa_column=_AUDIO_BYTES_COLUMN,
+        description="Raw audio bytes for the preview (if stored inline; deferred on load)",
     )
     is_representative: bool = Field(default=False, description="Whether this preview is the chosen representative")
-    created_at: datetime = Field(default_factory=utcnow, description="Creation timestamp")
+    created_at: datetime = Field(
+        default_factory=utcnow,
+        sa_column=Column(DateTime(timezone=True), default=utcnow, server_default=func.now(), nullable=False),
+        description="Creation timestamp",
+    )
 
 
-class AudioTranscript(SQLModel, table=True):
+class AudioTranscript(BulkInsertMixin, SQLModel, table=True):
     """Transcript associated with an audio preview."""
 
     __tablename__ = "audio_transcript"  # type: ignore[assignment]
+    __table_args__ = (
+        # Covers both per-NPC transcript listing and the selected-preview transcript lookup.
+        Index("ix_audio_transcript_npc_preview", "npc_id", "preview_id"),
+    )
 
     id: int | None = Field(default=None, primary_key=True, description="Primary key for the transcript")
-    npc_id: int = Field(index=True, foreign_key="npc.id", description="FK to npc.id")
+    npc_id: int = Field(foreign_key="npc.id", description="FK to npc.id")
     preview_id: int = Field(foreign_key="voice_preview.id", description="FK to voice_preview.id")
     provider: str = Field(description="Transcription provider")
     text: str = Field(description="Transcript text")
     metadata_json: dict[str, Any] = Field(
         default_factory=dict,
-        sa_column=Column(JSON),
+        sa_column=Column(json_column()),
         description="Additional metadata for the transcript",
     )
-    created_at: datetime = Field(default_factory=utcnow, description="Creation timestamp")
+    created_at: datetime = Field(
+        default_factory=utcnow,
+        sa_column=Column(DateTime(timezone=True), default=utcnow, server_default=func.now(), nullable=False),
+        description="Creation timestamp",
+    )
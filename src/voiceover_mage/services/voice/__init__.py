@@ -1 +1,5 @@
 """Voice generation service integrations (e.g., ElevenLabs)."""
+
+from .elevenlabs import ElevenLabsVoiceService
+
+__all__ = ["ElevenLabsVoiceService"]
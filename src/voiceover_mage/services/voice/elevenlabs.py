@@ -1,20 +1,63 @@
-import base64
+import asyncio
+import binascii
+import functools
+from collections.abc import Iterable
+from operator import attrgetter, itemgetter
+from typing import Any
 
 from elevenlabs import ElevenLabs
 
 from voiceover_mage.config import get_config
+from voiceover_mage.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# C-level accessors for the two response shapes the SDK may return
+_DICT_AUDIO = itemgetter("audio_base_64")
+_OBJECT_AUDIO = attrgetter("audio_base_64")
+
+
+def _decode_previews(resp: Any) -> tuple[bytes, ...]:
+    """Extract and base64-decode every audio clip from a text_to_voice.design response."""
+    # Support both object-like and dict-like SDK responses; probe the shape once, not per clip
+    previews = resp["previews"] if isinstance(resp, dict) else resp.previews
+    if not previews:
+        raise ValueError("No previews returned from ElevenLabs")
+
+    get_encoded = _DICT_AUDIO if isinstance(previews[0], dict) else _OBJECT_AUDIO
+
+    # a2b_base64 accepts the ASCII str directly, skipping b64decode's argument normalization.
+    audio_list: list[bytes] = []
+    for index, encoded in enumerate(map(get_encoded, previews)):
+        if isinstance(encoded, str | bytes) and encoded:
+            audio_list.append(binascii.a2b_base64(encoded))
+        else:
+            logger.warning("Skipping ElevenLabs preview without audio", index=index, value_type=type(encoded).__name__)
+    audio_clips = tuple(audio_list)
+
+    if not audio_clips:
+        raise ValueError("No valid audio clips found")
+
+    return audio_clips
+
+
+@functools.cache
+def _get_client(api_key: str) -> ElevenLabs:
+    """One SDK client per API key, so its HTTP connection pool is reused across services."""
+    return ElevenLabs(api_key=api_key)
 
 
 class ElevenLabsVoiceService:
     """Service for ElevenLabs API integration, focused on generating previews."""
 
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 8):
+        self.max_concurrency = max_concurrency
         config = get_config()
         if not config.elevenlabs_api_key:
             # Defer error to call site so pipeline can continue gracefully
             self.client: ElevenLabs | None = None
         else:
-            self.client = ElevenLabs(api_key=config.elevenlabs_api_key)
+            self.client = _get_client(config.elevenlabs_api_key)
 
     async def generate_preview_audio(
         self,
@@ -31,34 +74,32 @@ class ElevenLabsVoiceService:
         try:
             # If provided text is short, let ElevenLabs auto-generate matching text
             auto_generate = len(sample_text or "") < 100 or len(sample_text or "") > 1000
-            resp = self.client.text_to_voice.design(
+            # The SDK client is synchronous; run the HTTP round trip and the multi-MB
+            # base64 decode in worker threads so other pipelines keep the event loop.
+            resp = await asyncio.to_thread(
+                self.client.text_to_voice.design,
                 model_id="eleven_ttv_v3",
                 voice_description=voice_description,
                 text=sample_text if not auto_generate else None,
                 auto_generate_text=auto_generate,
             )
-
-            # Support both object-like and dict-like SDK responses without getattr
-            try:
-                previews = resp.previews  # type: ignore[attr-defined]
-            except Exception:
-                previews = resp["previews"] if isinstance(resp, dict) else None  # type: ignore[index]
-            if not previews:
-                raise ValueError("No previews returned from ElevenLabs")
-
-            # Convert all base64 audio previews to bytes
-            audio_list: list[bytes] = []
-            for clip in previews:
-                try:
-                    encoded = clip.audio_base_64  # type: ignore[attr-defined]
-                except Exception:
-                    encoded = clip.get("audio_base_64") if isinstance(clip, dict) else None  # type: ignore[call-overload]
-                if isinstance(encoded, str | bytes):
-                    audio_list.append(base64.b64decode(encoded))
-
-            if not audio_list:
-                raise ValueError("No valid audio clips found")
-
-            return tuple(audio_list)
+            return await asyncio.to_thread(_decode_previews, resp)
         except Exception as e:
             raise ConnectionError(f"Failed to generate voice preview: {e}") from e
+
+    async def generate_preview_audio_many(
+        self,
+        requests: Iterable[tuple[str, str]],
+    ) -> list[tuple[bytes, ...]]:
+        """Generate previews for several (voice_description, sample_text) pairs concurrently.
+
+        At most ``max_concurrency`` design calls are in flight at once. Results keep the
+        order of ``requests``; the first failure propagates as in ``generate_preview_audio``.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def generate_one(voice_description: str, sample_text: str) -> tuple[bytes, ...]:
+            async with semaphore:
+                return await self.generate_preview_audio(voice_description, sample_text)
+
+        return await asyncio.gather(*(generate_one(*request) for request in requests))
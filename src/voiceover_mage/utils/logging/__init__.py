@@ -10,7 +10,6 @@ from .enhanced_progress import (
     StageStatus,
     create_smart_progress,
 )
-from .progress import SimpleProgressTracker
 from .utils import get_logger, log_api_call, log_extraction_step, with_npc_context, with_pipeline_context
 
 __all__ = [
@@ -25,8 +24,6 @@ __all__ = [
     "PipelineStage",
     "StageStatus",
     "create_smart_progress",
-    # Legacy Progress (for compatibility)
-    "SimpleProgressTracker",
     # Utilities
     "get_logger",
     "log_api_call",
@@ -2,14 +2,256 @@
 # ABOUTME: Dual-mode operation: interactive CLI vs production JSON logging
 
 import contextlib
-import io
+import functools
 import logging
+import logging.config
 import os
+import queue
+import socket
 import sys
+import threading
+import time
+import traceback
+from collections.abc import Mapping
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, TextIO
 
 from loguru import logger
+from pydantic_core import to_json
+
+# Sink formats are compiled by loguru once per logger.add(); sharing the strings keeps
+# every sink on the same layout.
+TEXT_FORMAT = "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
+
+# Stdlib numeric levels for the level names accepted by configure_logging
+LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Interactive log locations, relative to the working directory
+LOG_DIR = "logs"
+LOG_FILES = {
+    "main": os.path.join(LOG_DIR, "voiceover-mage.log"),
+    "json": os.path.join(LOG_DIR, "voiceover-mage.json"),
+    "errors": os.path.join(LOG_DIR, "errors.log"),
+}
+
+# Log files rotate once they would exceed this many bytes (loguru's "10 MB")
+ROTATION_SIZE = 10 * 1000 * 1000
+
+# Rotated log files older than this are deleted (loguru's "7 days")
+LOG_RETENTION = timedelta(days=7)
+
+# Write buffer for the machine-readable JSON log file, and how often it is flushed while idle
+JSON_LOG_BUFFER_SIZE = 64 * 1024
+JSON_LOG_FLUSH_INTERVAL = 30.0
+
+# Process identity for JSON records, resolved once rather than per emitted line
+HOSTNAME = socket.gethostname()
+PID = os.getpid()
+
+
+def json_format(record: Any) -> str:
+    """Loguru format function that renders one JSON object per line with pydantic-core.
+
+    Used instead of loguru's ``serialize`` option, which builds a nested record dict and
+    encodes it with the stdlib json module on every emit.
+    """
+    extra = record["extra"]
+    exception = record["exception"]
+    payload = {
+        "time": record["time"],
+        "level": record["level"].name,
+        "hostname": HOSTNAME,
+        "pid": PID,
+        "name": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        "message": record["message"],
+        "extra": {key: value for key, value in extra.items() if key != "_json"},
+        "exception": (
+            {
+                "type": exception.type.__name__,
+                "value": str(exception.value),
+                "traceback": "".join(traceback.format_exception(exception.type, exception.value, exception.traceback)),
+            }
+            if exception and exception.type
+            else None
+        ),
+    }
+    # Each message gets its own extra dict, so stashing the rendered line there is safe
+    extra["_json"] = to_json(payload, fallback=str).decode()
+    return "{extra[_json]}\n"
+
+
+class SizeRotation:
+    """Rotation check that tracks the file size in memory.
+
+    Loguru's size rotation seeks to the end of the file before every message, which
+    costs a syscall per record and flushes any write buffer. This seeks once, then
+    counts the bytes written (log files are opened as UTF-8).
+    """
+
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._size: int | None = None
+
+    def __call__(self, message: str, file: TextIO) -> bool:
+        if self._size is None:
+            file.seek(0, os.SEEK_END)
+            self._size = file.tell()
+        size = len(message.encode())
+        self._size += size
+        if self._size > self._limit:
+            # The message that triggered rotation opens the new file
+            self._size = size
+            return True
+        return False
+
+
+class _BackgroundSink:
+    """Loguru sink that hands formatted lines to a writer thread.
+
+    Unlike ``enqueue=True``, only the rendered string crosses threads, so records are
+    never pickled and unpicklable bound values still go through json_format's fallback.
+    The worker writes everything queued so far in one call. Loguru calls ``stop`` when
+    the sink is removed, including from its exit hook, and the queue is drained first.
+    """
+
+    # Seconds between flushes while idle; None waits for the next line instead
+    flush_interval: float | None = None
+
+    def __init__(self, name: str) -> None:
+        self._queue: queue.SimpleQueue[tuple[str, int] | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def write(self, message: Any) -> None:
+        self._queue.put((str(message), message.record["level"].no))
+
+    def stop(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    @property
+    def running(self) -> bool:
+        """False once loguru has removed the sink and its worker has drained."""
+        return self._thread.is_alive()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._guarded(self._flush)
+                continue
+            lines: list[str] = []
+            highest = 0
+            while item is not None:
+                lines.append(item[0])
+                highest = max(highest, item[1])
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if lines:
+                self._guarded(self._write, "".join(lines), highest)
+            if item is None:
+                self._guarded(self._close)
+                return
+
+    @staticmethod
+    def _guarded(func: Any, *args: Any) -> None:
+        """Report a failed write the way loguru does, without killing the worker."""
+        try:
+            func(*args)
+        except Exception:
+            sys.stderr.write("--- Logging error in background sink ---\n")
+            traceback.print_exc(file=sys.stderr)
+
+    def _write(self, text: str, level_no: int) -> None:
+        raise NotImplementedError
+
+    def _flush(self) -> None:
+        pass
+
+    def _close(self) -> None:
+        pass
+
+
+class QueuedStream(_BackgroundSink):
+    """Background sink for a text stream, flushed after every batch."""
+
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+        super().__init__(name="log-stream-writer")
+
+    def _write(self, text: str, level_no: int) -> None:
+        self._stream.write(text)
+        self._stream.flush()
+
+
+class BackgroundFileSink(_BackgroundSink):
+    """Background sink for a log file with size rotation and age-based retention.
+
+    A batch holding a record at or above ``flush_level`` is flushed straight away; any
+    other batch stays in the write buffer until it fills, the idle timer fires, or the
+    sink stops. Rotated files are renamed with a timestamp, as loguru does.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        rotation: SizeRotation | None = None,
+        retention: timedelta | None = None,
+        buffering: int = -1,
+        flush_level: int = 0,
+        flush_interval: float | None = None,
+    ) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._rotation = rotation
+        self._retention = retention
+        self._buffering = buffering
+        self._flush_level = flush_level
+        self.flush_interval = flush_interval
+        self._file = self._open()
+        super().__init__(name=f"log-writer-{self._path.name}")
+
+    def _open(self) -> TextIO:
+        return open(self._path, "a", encoding="utf-8", buffering=self._buffering)  # noqa: SIM115
+
+    def _write(self, text: str, level_no: int) -> None:
+        if self._rotation is not None and self._rotation(text, self._file):
+            self._rotate()
+        self._file.write(text)
+        if level_no >= self._flush_level:
+            self._file.flush()
+
+    def _flush(self) -> None:
+        self._file.flush()
+
+    def _close(self) -> None:
+        self._file.close()
+
+    def _rotate(self) -> None:
+        self._file.close()
+        stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S_%f")
+        self._path.rename(self._path.with_name(f"{self._path.stem}.{stamp}{self._path.suffix}"))
+        if self._retention is not None:
+            cutoff = time.time() - self._retention.total_seconds()
+            for rotated in self._path.parent.glob(f"{self._path.stem}.*{self._path.suffix}"):
+                with contextlib.suppress(OSError):
+                    if rotated.stat().st_mtime < cutoff:
+                        rotated.unlink()
+        self._file = self._open()
 
 
 class LoggingMode:
@@ -28,32 +270,65 @@ def detect_logging_mode() -> str:
     return LoggingMode.INTERACTIVE if sys.stdout.isatty() else LoggingMode.PRODUCTION
 
 
-def setup_third_party_logging() -> None:
-    """Configure third-party library logging to avoid CLI interference."""
-    # Critical loggers (complete silence)
-    critical_loggers = [
-        "crawl4ai",
-        "crawl4ai.web_crawler",
-        "crawl4ai.chunking_strategy",
-        "crawl4ai.extraction_strategy",
-        "LiteLLM",
-        "litellm",
-        "selenium",
-        "playwright",
-        "undetected_chromedriver",
-    ]
+# Third-party loggers silenced completely
+CRITICAL_LOGGERS = (
+    "crawl4ai",
+    "crawl4ai.web_crawler",
+    "crawl4ai.chunking_strategy",
+    "crawl4ai.extraction_strategy",
+    "LiteLLM",
+    "litellm",
+    "selenium",
+    "playwright",
+    "undetected_chromedriver",
+)
+
+# Third-party loggers limited to warnings
+WARNING_LOGGERS = ("httpx", "httpcore", "urllib3", "requests", "asyncio", "websockets", "aiohttp")
+
+# Libraries reported as silenced by get_logging_status
+SUPPRESSED_LIBRARIES = ("crawl4ai", "httpx", "urllib3", "requests", "py.warnings", "LiteLLM", "selenium", "playwright")
+
+# Declarative stdlib levels for the third-party loggers; incremental so existing handlers stay put
+THIRD_PARTY_LOGGING_CONFIG: dict[str, Any] = {
+    "version": 1,
+    "incremental": True,
+    "loggers": {
+        **{name: {"level": "CRITICAL"} for name in CRITICAL_LOGGERS},
+        **{name: {"level": "WARNING"} for name in WARNING_LOGGERS},
+        "py.warnings": {"level": "ERROR"},
+    },
+}
+
+# Third-party levels only need applying once per process
+_third_party_configured = False
+_third_party_lock = threading.Lock()
+
+# Lowest stdlib level number any configured sink accepts; None until configure_logging runs
+_min_level_no: int | None = None
+
+# Arguments of the sinks currently installed by configure_logging, if any, and the sinks
+# themselves, whose workers stop if anything removes them from loguru
+_active_sinks: tuple[str, str, str | None, str | None] | None = None
+_installed_sinks: list[_BackgroundSink] = []
 
-    # Warning level loggers
-    warning_loggers = ["httpx", "httpcore", "urllib3", "requests", "asyncio", "websockets", "aiohttp"]
 
-    for logger_name in critical_loggers:
-        logging.getLogger(logger_name).setLevel(logging.CRITICAL)
+def setup_third_party_logging() -> None:
+    """Configure third-party library logging to avoid CLI interference."""
+    global _third_party_configured
+    if _third_party_configured:
+        return
+    with _third_party_lock:
+        if _third_party_configured:
+            return
+        logging.config.dictConfig(THIRD_PARTY_LOGGING_CONFIG)
+        logging.captureWarnings(True)
+        _third_party_configured = True
 
-    for logger_name in warning_loggers:
-        logging.getLogger(logger_name).setLevel(logging.WARNING)
 
-    logging.captureWarnings(True)
-    logging.getLogger("py.warnings").setLevel(logging.ERROR)
+def is_level_enabled(level: int) -> bool:
+    """Whether a record at this stdlib level would reach any configured sink."""
+    return _min_level_no is None or level >= _min_level_no
 
 
 def configure_logging(mode: str | None = None, log_level: str = "INFO", log_file: str | None = None) -> None:
@@ -68,106 +343,156 @@ def configure_logging(mode: str | None = None, log_level: str = "INFO", log_file
         mode = detect_logging_mode()
 
     setup_third_party_logging()
+    _build_logging_status.cache_clear()
 
     # Set standard library logging level for compatibility with tests
-    numeric_level = getattr(logging, log_level.upper(), logging.INFO)
-    logging.getLogger().setLevel(numeric_level)
+    # Normalize once: loguru level names are case-sensitive, and the stdlib lookup is a plain dict hit
+    global _min_level_no
+    log_level = log_level.upper()
+    _min_level_no = LOG_LEVELS.get(log_level, logging.INFO)
+    logging.getLogger().setLevel(_min_level_no)
+
+    # Re-adding identical sinks would reopen the same files; keep the ones already installed,
+    # unless something called logger.remove() since. Interactive sinks write to relative
+    # paths, so the working directory is part of the key.
+    global _active_sinks
+    try:
+        location: str | None = os.getcwd() if mode == LoggingMode.INTERACTIVE else ""
+    except OSError:
+        location = None  # Working directory is gone; always rebuild the sinks
+    sinks_key = (mode, log_level, log_file, location)
+    if (
+        location is not None
+        and sinks_key == _active_sinks
+        and _installed_sinks
+        and all(sink.running for sink in _installed_sinks)
+    ):
+        return
+    _active_sinks = sinks_key
 
     # Remove default loguru handler
     logger.remove()
+    _installed_sinks.clear()
 
     if mode == LoggingMode.INTERACTIVE:
         # Interactive mode: logs to files, no console interference
-        log_dir = Path("logs")
-
-        # Robust directory creation with retry logic for race conditions
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                log_dir.mkdir(exist_ok=True)
-                break
-            except (FileNotFoundError, PermissionError, OSError):
-                if attempt == max_retries - 1:
-                    # Final fallback: switch to production mode (no file logging)
-                    mode = LoggingMode.PRODUCTION
-                    break
-                # Brief pause to avoid tight retry loops
-                import time
+        log_dir = Path(LOG_DIR)
 
-                time.sleep(0.01 * (attempt + 1))  # 10ms, 20ms, 30ms
+        # exist_ok makes concurrent creation safe; any other failure means no file logging
+        try:
+            log_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            mode = LoggingMode.PRODUCTION
 
         # If we couldn't create the directory, fall back to production mode
         if mode == LoggingMode.PRODUCTION:
-            logger.add(sys.stdout, level=log_level, format="{time} | {level} | {name} | {message}", serialize=True)
+            _add_stdout_sink(log_level)
             return
 
-        log_file_path = log_file or str(log_dir / "voiceover-mage.log")
+        log_file_path = log_file or LOG_FILES["main"]
+
+        # File sinks write from their own threads; messages are still formatted where they are logged.
+
+        # Variable-annotated tracebacks walk every frame's locals; CI can opt out with VOICEOVER_MAGE_DIAGNOSE=0
+        diagnose = os.getenv("VOICEOVER_MAGE_DIAGNOSE", "1") == "1"
 
-        # Human-readable logs
-        logger.add(
-            log_file_path,
+        # Human-readable logs, flushed after every batch so they can be tailed
+        _add_sink(
+            BackgroundFileSink(log_file_path, rotation=SizeRotation(ROTATION_SIZE), retention=LOG_RETENTION),
             level=log_level,
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-            rotation="10 MB",
-            retention="7 days",
+            format=TEXT_FORMAT,
+            diagnose=diagnose,
         )
 
-        # JSON logs for machine processing
-        logger.add(
-            log_dir / "voiceover-mage.json",
+        # JSON logs for machine processing; block-buffered since nobody tails this file,
+        # flushed at once for errors, every JSON_LOG_FLUSH_INTERVAL seconds while idle, and on exit
+        _add_sink(
+            BackgroundFileSink(
+                LOG_FILES["json"],
+                rotation=SizeRotation(ROTATION_SIZE),
+                retention=LOG_RETENTION,
+                buffering=JSON_LOG_BUFFER_SIZE,
+                flush_level=logging.ERROR,
+                flush_interval=JSON_LOG_FLUSH_INTERVAL,
+            ),
             level=log_level,
-            format="{time} | {level} | {name} | {message}",
-            serialize=True,
-            rotation="10 MB",
-            retention="7 days",
+            format=json_format,
         )
 
         # Errors only
-        logger.add(
-            log_dir / "errors.log",
+        _add_sink(
+            BackgroundFileSink(LOG_FILES["errors"]),
             level="ERROR",
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-            backtrace=True,
-            diagnose=True,
+            format=TEXT_FORMAT,
+            backtrace=diagnose,
+            diagnose=diagnose,
         )
     else:
         # Production mode: JSON to stdout
-        logger.add(sys.stdout, level=log_level, format="{time} | {level} | {name} | {message}", serialize=True)
+        _add_stdout_sink(log_level)
 
 
-def get_logging_status() -> dict[str, Any]:
-    """Get current logging configuration status."""
+def _add_stdout_sink(log_level: str) -> None:
+    """Install the production JSON sink on stdout.
+
+    Lines are formatted on the logging thread and written and flushed by a QueuedStream
+    worker, so callers never block on the stdout write.
+    """
+    _add_sink(QueuedStream(sys.stdout), level=log_level, format=json_format)
+
+
+def _add_sink(sink: _BackgroundSink, **options: Any) -> None:
+    """Install a sink with loguru and remember it for the reuse check in configure_logging."""
+    logger.add(sink, **options)
+    _installed_sinks.append(sink)
+
+
+def get_logging_status() -> Mapping[str, Any]:
+    """Get current logging configuration status.
+
+    The result is a read-only mapping shared between calls with the same mode and log directory.
+    """
     mode = detect_logging_mode()
-    log_dir = Path("logs")
-
-    return {
-        "mode": mode,
-        "log_directory": str(log_dir.absolute()) if log_dir.exists() else None,
-        "log_files": {
-            "main": str(log_dir / "voiceover-mage.log") if mode == LoggingMode.INTERACTIVE else None,
-            "json": str(log_dir / "voiceover-mage.json") if mode == LoggingMode.INTERACTIVE else None,
-            "errors": str(log_dir / "errors.log") if mode == LoggingMode.INTERACTIVE else None,
-        },
-        "third_party_suppressed": [
-            "crawl4ai",
-            "httpx",
-            "urllib3",
-            "requests",
-            "py.warnings",
-            "LiteLLM",
-            "selenium",
-            "playwright",
-        ],
-    }
+    log_directory = os.path.abspath(LOG_DIR) if os.path.isdir(LOG_DIR) else None
+    return _build_logging_status(mode, log_directory)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_logging_status(mode: str, log_directory: str | None) -> Mapping[str, Any]:
+    """Assemble the status mapping; cached because it only varies with its arguments."""
+    interactive = mode == LoggingMode.INTERACTIVE
+    return MappingProxyType(
+        {
+            "mode": mode,
+            "log_directory": log_directory,
+            "log_files": MappingProxyType({name: path if interactive else None for name, path in LOG_FILES.items()}),
+            "third_party_suppressed": SUPPRESSED_LIBRARIES,
+        }
+    )
+
+
+@functools.cache
+def _devnull() -> TextIO:
+    """Shared sink for suppressed output, opened on first use and kept for the process."""
+    return open(os.devnull, "w")  # noqa: SIM115
 
 
 @contextlib.contextmanager
 def suppress_library_output():
-    """Context manager to completely suppress stdout/stderr from noisy libraries."""
+    """Context manager to completely suppress stdout/stderr from noisy libraries.
+
+    Output goes to os.devnull rather than an in-memory buffer, so long crawls
+    do not accumulate everything the libraries print.
+    """
+    devnull = _devnull()
     original_stdout, original_stderr = sys.stdout, sys.stderr
+    if original_stdout is devnull and original_stderr is devnull:
+        # Already inside a suppressed block; nothing to swap or restore
+        yield
+        return
 
     try:
-        sys.stdout = sys.stderr = io.StringIO()
+        sys.stdout = sys.stderr = devnull
         yield
     finally:
         sys.stdout, sys.stderr = original_stdout, original_stderr
@@ -3,16 +3,17 @@
 
 from __future__ import annotations
 
-import contextlib
+import threading
+import time
+from collections import Counter
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import timedelta
 from enum import Enum
 from typing import Any, TypeVar
 
 from rich.box import ROUNDED
 from rich.console import Console
-from rich.layout import Layout
 from rich.live import Live
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
@@ -21,6 +22,9 @@ from rich.text import Text
 
 T = TypeVar("T")
 
+# Live's background redraw only has to keep the elapsed clock ticking; stage changes redraw at once
+CLOCK_REFRESH_INTERVAL = 1.0
+
 
 class PipelineStage(Enum):
     """Pipeline stages for NPC processing."""
@@ -41,78 +45,203 @@ class StageStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+# Display order of the stages in the dashboard
+STAGE_ORDER = (
+    PipelineStage.RAW_EXTRACTION,
+    PipelineStage.LLM_EXTRACTION,
+    PipelineStage.INTELLIGENT_ANALYSIS,
+    PipelineStage.VOICE_GENERATION,
+)
+
+STATUS_ICONS = {
+    StageStatus.PENDING: "⏳",
+    StageStatus.IN_PROGRESS: "🔄",
+    StageStatus.COMPLETED: "✅",
+    StageStatus.ERROR: "❌",
+    StageStatus.SKIPPED: "⏭️",
+}
+
+# Stage name styling by status
+STATUS_NAME_STYLES = {
+    StageStatus.PENDING: "dim",
+    StageStatus.IN_PROGRESS: "bold yellow",
+    StageStatus.COMPLETED: "bold green",
+    StageStatus.ERROR: "bold red",
+    StageStatus.SKIPPED: "dim",
+}
+
+# Full stage names for the progressive dashboard
+STAGE_NAMES = {
+    PipelineStage.RAW_EXTRACTION: "Raw Data Extraction",
+    PipelineStage.LLM_EXTRACTION: "LLM Enhancement",
+    PipelineStage.INTELLIGENT_ANALYSIS: "Character Analysis",
+    PipelineStage.VOICE_GENERATION: "Voice Generation",
+}
+
+# Fixed progressive-dashboard details for running and pending stages
+STATIC_STAGE_DETAILS = {
+    (StageStatus.IN_PROGRESS, PipelineStage.RAW_EXTRACTION): "🌐 Fetching NPC data from OSRS Wiki...",
+    (StageStatus.IN_PROGRESS, PipelineStage.LLM_EXTRACTION): "🧠 Enhancing raw data with LLM analysis...",
+    (StageStatus.IN_PROGRESS, PipelineStage.INTELLIGENT_ANALYSIS): "🎭 Extracting character traits and personality...",
+    (StageStatus.IN_PROGRESS, PipelineStage.VOICE_GENERATION): "🎵 Creating voice samples with ElevenLabs...",
+    (StageStatus.PENDING, PipelineStage.RAW_EXTRACTION): "📋 Will extract NPC data, dialogue, and images",
+    (StageStatus.PENDING, PipelineStage.LLM_EXTRACTION): "🔍 Will enhance data with contextual analysis",
+    (StageStatus.PENDING, PipelineStage.INTELLIGENT_ANALYSIS): "🎯 Will analyze personality for voice generation",
+    (StageStatus.PENDING, PipelineStage.VOICE_GENERATION): "🎤 Will create multiple voice sample options",
+}
+
+# Stage names and status cells for create_stage_status_table
+STATUS_TABLE_STAGE_NAMES = {
+    PipelineStage.RAW_EXTRACTION: "Raw Extraction",
+    PipelineStage.LLM_EXTRACTION: "LLM Extraction",
+    PipelineStage.INTELLIGENT_ANALYSIS: "Analysis",
+    PipelineStage.VOICE_GENERATION: "Voice Generation",
+}
+
+STATUS_TABLE_STYLES = {
+    StageStatus.PENDING: ("⏳ Pending", "dim"),
+    StageStatus.IN_PROGRESS: ("🔄 Running", "yellow"),
+    StageStatus.COMPLETED: ("✅ Done", "green"),
+    StageStatus.ERROR: ("❌ Error", "red"),
+    StageStatus.SKIPPED: ("⏭️ Skipped", "blue"),
+}
+
+
+@dataclass(slots=True)
 class StageInfo:
     """Information about a pipeline stage."""
 
     stage: PipelineStage
     status: StageStatus = StageStatus.PENDING
-    start_time: datetime | None = None
-    end_time: datetime | None = None
+    # time.monotonic() readings
+    start_time: float | None = None
+    end_time: float | None = None
     data: dict[str, Any] = field(default_factory=dict)
     error_message: str | None = None
 
     @property
     def duration(self) -> timedelta | None:
         """Get stage duration if completed."""
-        if self.start_time and self.end_time:
-            return self.end_time - self.start_time
+        if self.start_time is not None and self.end_time is not None:
+            return timedelta(seconds=self.end_time - self.start_time)
         return None
 
     @property
     def elapsed_time(self) -> timedelta | None:
         """Get elapsed time since stage started."""
-        if self.start_time:
-            end = self.end_time or datetime.now()
-            return end - self.start_time
+        if self.start_time is not None:
+            end = self.end_time if self.end_time is not None else time.monotonic()
+            return timedelta(seconds=end - self.start_time)
         return None
 
 
+def _stage_row_key(info: StageInfo) -> Any:
+    """Build a cache key covering everything a rendered stage row depends on."""
+    try:
+        data_key: Any = frozenset(info.data.items()) if info.data else None
+        hash(data_key)
+    except TypeError:
+        data_key = repr(info.data)  # Lists and dicts in stage data are unhashable
+    return (info.status, info.error_message, info.start_time, info.end_time, data_key)
+
+
 class PipelineDashboard:
     """Live dashboard for pipeline progress with real-time updates."""
 
-    def __init__(self, console: Console, npc_id: int, npc_name: str):
+    def __init__(
+        self,
+        console: Console,
+        npc_id: int,
+        npc_name: str,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         self.console = console
         self.npc_id = npc_id
         self.npc_name = npc_name
-        self.pipeline_start = datetime.now()
-        self.stages: dict[PipelineStage, StageInfo] = {stage: StageInfo(stage=stage) for stage in PipelineStage}
+        # Source of every timestamp the dashboard records; tests pass a fake
+        self.clock = clock
+        self.pipeline_start = clock()
+        # Header clock text, reformatted only when the elapsed second changes
+        self._elapsed_second = -1
+        self._elapsed_str = ""
+        self.stages: dict[PipelineStage, StageInfo] = {stage: StageInfo(stage=stage) for stage in STAGE_ORDER}
+        # Same StageInfo objects in display order, so renders iterate without hashing enum keys
+        self._stage_list = tuple(self.stages.values())
+        # Set by every mutator so the live display only rebuilds when something changed
+        self._dirty = True
+        # Called after every change (the live display passes Live.refresh), so updates show without polling
+        self.on_change: Callable[[], None] | None = None
+        # Live renders from its refresh thread while the pipeline mutates stages on the event loop
+        self._lock = threading.RLock()
+        # Last full panel, handed back to Live until the dashboard changes
+        self._panel: Panel | None = None
+        # Rendered stage rows keyed by the stage state they were built from
+        self._row_cache: list[tuple[Any, Text] | None] = [None] * len(self._stage_list)
+
+    def _changed(self) -> None:
+        """Mark the panel stale and let the live display redraw it."""
+        with self._lock:
+            self._dirty = True
+        if self.on_change is not None:
+            self.on_change()
 
     def start_stage(self, stage: PipelineStage) -> None:
         """Mark a stage as started."""
-        self.stages[stage].status = StageStatus.IN_PROGRESS
-        self.stages[stage].start_time = datetime.now()
+        with self._lock:
+            self.stages[stage].status = StageStatus.IN_PROGRESS
+            self.stages[stage].start_time = self.clock()
+        self._changed()
 
     def complete_stage(self, stage: PipelineStage, data: dict[str, Any] | None = None) -> None:
         """Mark a stage as completed with optional data."""
-        stage_info = self.stages[stage]
-        stage_info.status = StageStatus.COMPLETED
-        stage_info.end_time = datetime.now()
-        if data:
-            stage_info.data.update(data)
+        with self._lock:
+            stage_info = self.stages[stage]
+            stage_info.status = StageStatus.COMPLETED
+            stage_info.end_time = self.clock()
+            if data:
+                stage_info.data.update(data)
+        self._changed()
 
     def error_stage(self, stage: PipelineStage, error: str) -> None:
         """Mark a stage as errored."""
-        stage_info = self.stages[stage]
-        stage_info.status = StageStatus.ERROR
-        stage_info.end_time = datetime.now()
-        stage_info.error_message = error
+        with self._lock:
+            stage_info = self.stages[stage]
+            stage_info.status = StageStatus.ERROR
+            stage_info.end_time = self.clock()
+            stage_info.error_message = error
+        self._changed()
 
     def skip_stage(self, stage: PipelineStage, reason: str) -> None:
         """Mark a stage as skipped."""
-        stage_info = self.stages[stage]
-        stage_info.status = StageStatus.SKIPPED
-        stage_info.data["skip_reason"] = reason
+        with self._lock:
+            stage_info = self.stages[stage]
+            stage_info.status = StageStatus.SKIPPED
+            stage_info.data["skip_reason"] = reason
+        self._changed()
 
     def update_stage_data(self, stage: PipelineStage, data: dict[str, Any]) -> None:
         """Update stage data without changing status."""
-        self.stages[stage].data.update(data)
+        with self._lock:
+            self.stages[stage].data.update(data)
+        self._changed()
+
+    def get_renderable(self) -> Panel:
+        """Return the dashboard panel, rebuilding it only on stage changes or clock ticks."""
+        with self._lock:
+            if self._panel is None or self._dirty or int(self.clock() - self.pipeline_start) != self._elapsed_second:
+                self._dirty = False
+                self._panel = self.create_renderable()
+            return self._panel
 
     def create_renderable(self) -> Panel:
         """Create a progressive rich renderable for the live dashboard."""
         # Calculate elapsed time
-        elapsed = datetime.now() - self.pipeline_start
-        elapsed_str = f"{elapsed.seconds // 60:02d}:{elapsed.seconds % 60:02d}"
+        elapsed_second = int(self.clock() - self.pipeline_start)
+        if elapsed_second != self._elapsed_second:
+            self._elapsed_second = elapsed_second
+            minutes, seconds = divmod(elapsed_second, 60)
+            self._elapsed_str = f"{minutes:02d}:{seconds:02d}"
+        elapsed_str = self._elapsed_str
 
         # Create main content table
         content = Table.grid(padding=(0, 1), expand=True)
@@ -142,55 +271,25 @@ class PipelineDashboard:
         table = Table(box=None, expand=True, show_header=False, padding=(0, 1))
         table.add_column("Stage", width=None)
 
-        stage_order = [
-            PipelineStage.RAW_EXTRACTION,
-            PipelineStage.LLM_EXTRACTION,
-            PipelineStage.INTELLIGENT_ANALYSIS,
-            PipelineStage.VOICE_GENERATION,
-        ]
-
-        for stage in stage_order:
-            info = self.stages[stage]
-            stage_row = self._format_progressive_stage(stage, info)
+        for position, info in enumerate(self._stage_list):
+            key = _stage_row_key(info)
+            cached = self._row_cache[position]
+            if cached is not None and cached[0] == key:
+                stage_row = cached[1]
+            else:
+                stage_row = self._format_progressive_stage(info.stage, info)
+                self._row_cache[position] = (key, stage_row)
             table.add_row(stage_row)
 
         return table
 
     def _format_progressive_stage(self, stage: PipelineStage, info: StageInfo) -> Text:
         """Format a stage for progressive display - more details as we progress."""
-        # Status icons
-        status_icons = {
-            StageStatus.PENDING: "⏳",
-            StageStatus.IN_PROGRESS: "🔄",
-            StageStatus.COMPLETED: "✅",
-            StageStatus.ERROR: "❌",
-            StageStatus.SKIPPED: "⏭️",
-        }
-
-        # Full stage names
-        stage_names = {
-            PipelineStage.RAW_EXTRACTION: "Raw Data Extraction",
-            PipelineStage.LLM_EXTRACTION: "LLM Enhancement",
-            PipelineStage.INTELLIGENT_ANALYSIS: "Character Analysis",
-            PipelineStage.VOICE_GENERATION: "Voice Generation",
-        }
-
-        icon = status_icons[info.status]
-        name = stage_names[stage]
+        icon = STATUS_ICONS[info.status]
+        name = STAGE_NAMES[stage]
 
         # Create rich text with progressive detail
-        text = Text()
-        text.append(f"{icon} ", style="bold")
-
-        # Stage name with status-based styling
-        if info.status == StageStatus.COMPLETED:
-            text.append(name, style="bold green")
-        elif info.status == StageStatus.IN_PROGRESS:
-            text.append(name, style="bold yellow")
-        elif info.status == StageStatus.ERROR:
-            text.append(name, style="bold red")
-        else:
-            text.append(name, style="dim")
+        text = Text.assemble((f"{icon} ", "bold"), (name, STATUS_NAME_STYLES[info.status]))
 
         # Add progressive details based on stage completion
         details = self._get_progressive_stage_details(stage, info)
@@ -208,27 +307,11 @@ class PipelineDashboard:
             reason = info.data.get("skip_reason", "No reason provided")
             return f"⏭️ Skipped: {reason}"
 
-        if info.status == StageStatus.IN_PROGRESS:
-            # Show current operation
-            progress_details = {
-                PipelineStage.RAW_EXTRACTION: "🌐 Fetching NPC data from OSRS Wiki...",
-                PipelineStage.LLM_EXTRACTION: "🧠 Enhancing raw data with LLM analysis...",
-                PipelineStage.INTELLIGENT_ANALYSIS: "🎭 Extracting character traits and personality...",
-                PipelineStage.VOICE_GENERATION: "🎵 Creating voice samples with ElevenLabs...",
-            }
-            return progress_details.get(stage, "⚡ Processing...")
-
         if info.status == StageStatus.COMPLETED:
             return self._get_completed_progressive_details(stage, info)
 
-        # Pending stages - show what they'll do
-        pending_details = {
-            PipelineStage.RAW_EXTRACTION: "📋 Will extract NPC data, dialogue, and images",
-            PipelineStage.LLM_EXTRACTION: "🔍 Will enhance data with contextual analysis",
-            PipelineStage.INTELLIGENT_ANALYSIS: "🎯 Will analyze personality for voice generation",
-            PipelineStage.VOICE_GENERATION: "🎤 Will create multiple voice sample options",
-        }
-        return pending_details.get(stage, "⏸️ Waiting...")
+        # Running stages show the current operation, pending ones what they'll do
+        return STATIC_STAGE_DETAILS.get((info.status, stage), "⏸️ Waiting...")
 
     def _get_completed_progressive_details(self, stage: PipelineStage, info: StageInfo) -> str:
         """Get detailed completion information for progressive display."""
@@ -283,38 +366,31 @@ class PipelineDashboard:
 
     def _create_summary_footer(self) -> Text:
         """Create a summary footer with key metrics."""
-        # Progress counts - debug the stage statuses
-        error_count = sum(1 for s in self.stages.values() if s.status == StageStatus.ERROR)
-        skipped_count = sum(1 for s in self.stages.values() if s.status == StageStatus.SKIPPED)
-        total_stages = len(self.stages)
-
-        # Debug: Force refresh the counts by checking actual stage statuses
-        actual_completed = 0
-        for _stage, info in self.stages.items():
-            if info.status == StageStatus.COMPLETED:
-                actual_completed += 1
+        # Progress counts from a single pass over the stages
+        counts = Counter(info.status for info in self._stage_list)
+        completed = counts[StageStatus.COMPLETED]
+        error_count = counts[StageStatus.ERROR]
+        skipped_count = counts[StageStatus.SKIPPED]
+        total_stages = len(self._stage_list)
 
         # Create summary text
         summary = Text()
 
-        # Use the actual completed count instead of the calculated one
-        display_completed = actual_completed
-
         # Progress indicator - build with proper Text styling
         summary.append("📊 Progress: ", style="default")
 
         if error_count > 0:
-            summary.append(f"{display_completed}/{total_stages}", style="bold red")
+            summary.append(f"{completed}/{total_stages}", style="bold red")
             error_suffix = f" ({error_count} errors"
             if skipped_count > 0:
                 error_suffix += f", {skipped_count} skipped"
             error_suffix += ")"
             summary.append(error_suffix, style="default")
         elif skipped_count > 0:
-            summary.append(f"{display_completed}/{total_stages}", style="bold yellow")
+            summary.append(f"{completed}/{total_stages}", style="bold yellow")
             summary.append(f" stages ({skipped_count} skipped)", style="default")
         else:
-            summary.append(f"{display_completed}/{total_stages}", style="bold green")
+            summary.append(f"{completed}/{total_stages}", style="bold green")
             summary.append(" stages complete", style="default")
 
         # Add confidence if available
@@ -332,228 +408,6 @@ class PipelineDashboard:
 
         return summary
 
-    def _create_compact_stages_table(self) -> Table:
-        """Create a compact table showing all stages in a single row."""
-        table = Table.grid(padding=(0, 2))
-
-        # Add columns for each stage
-        for _ in PipelineStage:
-            table.add_column()
-
-        # Create stage displays
-        stage_displays = []
-        stage_order = [
-            PipelineStage.RAW_EXTRACTION,
-            PipelineStage.LLM_EXTRACTION,
-            PipelineStage.INTELLIGENT_ANALYSIS,
-            PipelineStage.VOICE_GENERATION,
-        ]
-
-        for stage in stage_order:
-            info = self.stages[stage]
-            display = self._format_compact_stage(stage, info)
-            stage_displays.append(display)
-
-        table.add_row(*stage_displays)
-        return table
-
-    def _format_compact_stage(self, stage: PipelineStage, info: StageInfo) -> Text:
-        """Format a stage for compact display."""
-        # Status icons
-        status_icons = {
-            StageStatus.PENDING: "⏳",
-            StageStatus.IN_PROGRESS: "🔄",
-            StageStatus.COMPLETED: "✅",
-            StageStatus.ERROR: "❌",
-            StageStatus.SKIPPED: "⏭️",
-        }
-
-        # Short stage names
-        stage_names = {
-            PipelineStage.RAW_EXTRACTION: "Extract",
-            PipelineStage.LLM_EXTRACTION: "Enhance",
-            PipelineStage.INTELLIGENT_ANALYSIS: "Analyze",
-            PipelineStage.VOICE_GENERATION: "Voice",
-        }
-
-        icon = status_icons[info.status]
-        name = stage_names[stage]
-
-        # Create compact text
-        text = Text()
-        text.append(f"{icon} ", style="bold")
-
-        # Stage name with status-based styling
-        if info.status == StageStatus.COMPLETED:
-            text.append(name, style="bold green")
-        elif info.status == StageStatus.IN_PROGRESS:
-            text.append(name, style="bold yellow")
-        elif info.status == StageStatus.ERROR:
-            text.append(name, style="bold red")
-        else:
-            text.append(name, style="dim")
-
-        # Add brief data on next line
-        details = self._get_compact_stage_details(stage, info)
-        if details:
-            text.append(f"\n{details}", style="dim cyan")
-
-        return text
-
-    def _get_compact_stage_details(self, stage: PipelineStage, info: StageInfo) -> str:
-        """Get brief details for compact display."""
-        if info.status == StageStatus.ERROR and info.error_message:
-            return f"⚠️ {info.error_message[:20]}..."
-
-        if info.status == StageStatus.SKIPPED:
-            return "⏭️ Skipped"
-
-        if info.status == StageStatus.IN_PROGRESS:
-            return "⚡ Working..."
-
-        if info.status == StageStatus.COMPLETED:
-            data = info.data
-            if stage == PipelineStage.RAW_EXTRACTION:
-                chars = data.get("markdown_chars", 0)
-                return f"📄 {chars:,} chars"
-            elif stage == PipelineStage.INTELLIGENT_ANALYSIS:
-                confidence = data.get("confidence", 0)
-                if confidence:
-                    # Store latest confidence for footer
-                    self._latest_confidence = confidence
-                    return f"🎯 {confidence:.0%}"
-                return "✓ Done"
-            elif stage == PipelineStage.VOICE_GENERATION:
-                samples = data.get("voice_samples", 0)
-                return f"🎵 {samples} samples" if samples else "✓ Done"
-            else:
-                return "✓ Done"
-
-        return ""
-
-    def _create_stages_panel(self) -> Panel:
-        """Create the stages progress panel."""
-        layout = Layout()
-        layout.split_row(Layout(name="left"), Layout(name="right"))
-
-        # Left side - Raw and LLM extraction
-        left_stages = [PipelineStage.RAW_EXTRACTION, PipelineStage.LLM_EXTRACTION]
-        left_table = self._create_stage_table(left_stages)
-        layout["left"].update(left_table)
-
-        # Right side - Analysis and Voice generation
-        right_stages = [PipelineStage.INTELLIGENT_ANALYSIS, PipelineStage.VOICE_GENERATION]
-        right_table = self._create_stage_table(right_stages)
-        layout["right"].update(right_table)
-
-        return Panel(layout, title="🔄 Pipeline Stages", border_style="cyan")
-
-    def _create_stage_table(self, stages: list[PipelineStage]) -> Table:
-        """Create a table for specific stages."""
-        table = Table(box=ROUNDED, expand=True, show_header=False)
-        table.add_column("Stage", style="bold", width=None)
-
-        for stage in stages:
-            stage_info = self.stages[stage]
-            stage_text = self._format_stage_display(stage, stage_info)
-            table.add_row(stage_text)
-
-        return table
-
-    def _format_stage_display(self, stage: PipelineStage, info: StageInfo) -> Text:
-        """Format a stage for display with status and data."""
-        # Status icon
-        status_icons = {
-            StageStatus.PENDING: "⏳",
-            StageStatus.IN_PROGRESS: "🔄",
-            StageStatus.COMPLETED: "✅",
-            StageStatus.ERROR: "❌",
-            StageStatus.SKIPPED: "⏭️",
-        }
-
-        # Stage names
-        stage_names = {
-            PipelineStage.RAW_EXTRACTION: "Raw Extraction",
-            PipelineStage.LLM_EXTRACTION: "LLM Extraction",
-            PipelineStage.INTELLIGENT_ANALYSIS: "Intelligent Analysis",
-            PipelineStage.VOICE_GENERATION: "Voice Generation",
-        }
-
-        icon = status_icons[info.status]
-        name = stage_names[stage]
-
-        # Create rich text with styling
-        text = Text()
-        text.append(f"{icon} ", style="bold")
-
-        # Stage name with status-based styling
-        if info.status == StageStatus.COMPLETED:
-            text.append(name, style="bold green")
-        elif info.status == StageStatus.IN_PROGRESS:
-            text.append(name, style="bold yellow")
-        elif info.status == StageStatus.ERROR:
-            text.append(name, style="bold red")
-        else:
-            text.append(name, style="dim")
-
-        text.append("\n")
-
-        # Add stage-specific data
-        details = self._get_stage_details(stage, info)
-        if details:
-            text.append(f"    └─ {details}", style="dim cyan")
-
-        return text
-
-    def _get_stage_details(self, stage: PipelineStage, info: StageInfo) -> str:
-        """Get formatted details for a stage."""
-        if info.status == StageStatus.ERROR and info.error_message:
-            return f"Error: {info.error_message}"
-
-        if info.status == StageStatus.SKIPPED:
-            reason = info.data.get("skip_reason", "No reason provided")
-            return f"Skipped: {reason}"
-
-        if info.status == StageStatus.IN_PROGRESS:
-            return self._get_in_progress_details(stage, info)
-
-        if info.status == StageStatus.COMPLETED:
-            return self._get_completed_details(stage, info)
-
-        return "Pending..."
-
-    def _get_in_progress_details(self, stage: PipelineStage, info: StageInfo) -> str:
-        """Get details for in-progress stages."""
-        details_map = {
-            PipelineStage.RAW_EXTRACTION: "Scraping wiki data...",
-            PipelineStage.LLM_EXTRACTION: "Enhancing with LLM analysis...",
-            PipelineStage.INTELLIGENT_ANALYSIS: "Analyzing character traits...",
-            PipelineStage.VOICE_GENERATION: "Generating voice samples...",
-        }
-        return details_map.get(stage, "Processing...")
-
-    def _get_completed_details(self, stage: PipelineStage, info: StageInfo) -> str:
-        """Get details for completed stages."""
-        data = info.data
-
-        if stage == PipelineStage.RAW_EXTRACTION:
-            chars = data.get("markdown_chars", 0)
-            images = "with images" if data.get("has_images") else "no images"
-            return f"Markdown: {chars:,} chars, {images}"
-
-        elif stage == PipelineStage.LLM_EXTRACTION:
-            return "Enhanced data loaded"
-
-        elif stage == PipelineStage.INTELLIGENT_ANALYSIS:
-            confidence = data.get("confidence", 0)
-            return f"Confidence: {confidence:.1%}" if confidence else "Analysis complete"
-
-        elif stage == PipelineStage.VOICE_GENERATION:
-            samples = data.get("voice_samples", 0)
-            return f"{samples} voice samples generated" if samples else "Voice generated"
-
-        return "Complete"
-
 
 def create_rich_table(
     title: str,
@@ -605,24 +459,9 @@ def create_stage_status_table(stages: dict[PipelineStage, StageInfo]) -> Table:
     table.add_column("Status", justify="center", width=12)
     table.add_column("Details", style="dim")
 
-    stage_names = {
-        PipelineStage.RAW_EXTRACTION: "Raw Extraction",
-        PipelineStage.LLM_EXTRACTION: "LLM Extraction",
-        PipelineStage.INTELLIGENT_ANALYSIS: "Analysis",
-        PipelineStage.VOICE_GENERATION: "Voice Generation",
-    }
-
-    status_styles = {
-        StageStatus.PENDING: ("⏳ Pending", "dim"),
-        StageStatus.IN_PROGRESS: ("🔄 Running", "yellow"),
-        StageStatus.COMPLETED: ("✅ Done", "green"),
-        StageStatus.ERROR: ("❌ Error", "red"),
-        StageStatus.SKIPPED: ("⏭️ Skipped", "blue"),
-    }
-
     for stage, info in stages.items():
-        name = stage_names.get(stage, stage.value)
-        status_text, status_style = status_styles[info.status]
+        name = STATUS_TABLE_STAGE_NAMES.get(stage, stage.value)
+        status_text, status_style = STATUS_TABLE_STYLES[info.status]
 
         details = ""
         if info.status == StageStatus.ERROR and info.error_message:
@@ -648,7 +487,7 @@ class EnhancedProgressReporter:
         operation: Callable[[PipelineDashboard], Awaitable[T]],
         npc_id: int,
         npc_name: str,
-        refresh_rate: float = 0.25,
+        refresh_rate: float = CLOCK_REFRESH_INTERVAL,
     ) -> T:
         """Run an async operation with a live pipeline dashboard.
 
@@ -656,44 +495,26 @@ class EnhancedProgressReporter:
             operation: Async operation that takes a dashboard and returns a result
             npc_id: NPC ID being processed
             npc_name: NPC name for display
-            refresh_rate: Dashboard refresh rate in seconds
+            refresh_rate: Seconds between Live's background redraws, which keep the elapsed
+                clock current; stage changes redraw immediately
 
         Returns:
             Result from the operation
         """
         dashboard = PipelineDashboard(console=self.console, npc_id=npc_id, npc_name=npc_name)
 
+        # Live pulls the panel on each refresh; stopping Live renders the final state
         with Live(
-            dashboard.create_renderable(),
             console=self.console,
             refresh_per_second=1 / refresh_rate,
             transient=False,
+            get_renderable=dashboard.get_renderable,
         ) as live:
-            # Update the live display as the dashboard changes
-            async def wrapped_operation():
-                result = await operation(dashboard)
-                # Final update
-                live.update(dashboard.create_renderable())
-                return result
-
-            # Periodically update the display
-            import asyncio
-
-            async def update_display():
-                while True:
-                    live.update(dashboard.create_renderable())
-                    await asyncio.sleep(refresh_rate)
-
-            # Run operation and display updates concurrently
-            update_task = asyncio.create_task(update_display())
+            dashboard.on_change = live.refresh
             try:
-                result = await wrapped_operation()
+                return await operation(dashboard)
             finally:
-                update_task.cancel()
-                with contextlib.suppress(asyncio.CancelledError):
-                    await update_task
-
-            return result
+                dashboard.on_change = None
 
     async def run_with_status(
         self,
@@ -744,7 +565,7 @@ class EnhancedProgressReporter:
 
 def create_smart_progress(
     console: Console, initial_description: str = "🪄 Invoking magical operations..."
-) -> tuple[Progress, Any, SimpleProgressTracker]:
+) -> tuple[Progress, Any]:
     """Create enhanced smart progress with better styling.
 
     This maintains API compatibility while providing enhanced visuals.
@@ -758,30 +579,5 @@ def create_smart_progress(
     )
 
     task_id = progress.add_task(initial_description, total=None)
-    tracker = SimpleProgressTracker(progress, task_id)
-
-    return progress, task_id, tracker
-
-
-class SimpleProgressTracker:
-    """Enhanced progress tracker with better visual feedback."""
-
-    def __init__(self, progress: Progress, task_id: Any):
-        self.progress = progress
-        self.task_id = task_id
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        pass
-
-    def update_description(self, description: str) -> None:
-        """Update the progress description."""
-        self.progress.update(self.task_id, description=description)
 
-    def update_with_data(self, description: str, **data) -> None:
-        """Update progress with contextual data."""
-        data_str = ", ".join(f"{k}: {v}" for k, v in data.items())
-        full_description = f"{description} ({data_str})" if data_str else description
-        self.update_description(full_description)
+    return progress, task_id
@@ -6,23 +6,9 @@ from typing import Any
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 
-class SimpleProgressTracker:
-    """Simple progress tracker with Rich spinner."""
-
-    def __init__(self, progress: Progress, task_id: Any):
-        self.progress = progress
-        self.task_id = task_id
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        pass
-
-
 def create_smart_progress(
     console, initial_description: str = "🪄 Invoking magical operations..."
-) -> tuple[Progress, Any, SimpleProgressTracker]:
+) -> tuple[Progress, Any]:
     """Create a simple progress display with spinner.
 
     Args:
@@ -30,13 +16,12 @@ def create_smart_progress(
         initial_description: Initial progress description
 
     Returns:
-        Tuple of (progress, task_id, tracker)
+        Tuple of (progress, task_id); use the progress itself as the context manager
     """
     progress = Progress(
         SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console, transient=True
     )
 
     task_id = progress.add_task(initial_description, total=None)
-    tracker = SimpleProgressTracker(progress, task_id)
 
-    return progress, task_id, tracker
+    return progress, task_id
@@ -2,13 +2,16 @@
 # ABOUTME: Provides get_logger function and decorators for consistent structured logging
 
 import functools
+import logging
+import os
 import time
-import uuid
 from collections.abc import Callable
 from typing import Any, TypeVar
 
 from loguru import logger
 
+from .config import is_level_enabled
+
 # Type variable for decorated functions
 F = TypeVar("F", bound=Callable[..., Any])
 
@@ -31,12 +34,18 @@ def get_logger(name: str | None = None) -> Any:
             caller_module = frame.f_back.f_globals.get("__name__", "unknown")
             name = caller_module
 
-    return logger.bind(name=name or "voiceover_mage")
+    return _named_logger(name or "voiceover_mage")
+
+
+@functools.lru_cache(maxsize=1024)
+def _named_logger(name: str) -> Any:
+    """Bind a logger name once; bound loguru loggers are immutable and share the sinks."""
+    return logger.bind(name=name)
 
 
 def generate_operation_id() -> str:
     """Generate a unique operation ID for tracking requests."""
-    return str(uuid.uuid4())[:8]
+    return os.urandom(4).hex()
 
 
 def with_operation_context(operation: str, **context) -> Callable[[F], F]:
@@ -51,27 +60,32 @@ def with_operation_context(operation: str, **context) -> Callable[[F], F]:
     """
 
     def decorator(func: F) -> F:
+        # Only the operation id differs between calls
+        base_logger = get_logger(func.__module__).bind(operation=operation, function=func.__name__, **context)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            logger = get_logger(func.__module__)
-            operation_id = generate_operation_id()
+            # Below INFO only failures are logged; skip the id, timing and start/finish records
+            if not is_level_enabled(logging.INFO):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    base_logger.error(f"Failed {operation}", error=str(e), error_type=type(e).__name__, success=False)
+                    raise
 
-            # Bind operation context
-            bound_logger = logger.bind(
-                operation=operation, operation_id=operation_id, function=func.__name__, **context
-            )
+            bound_logger = base_logger.bind(operation_id=generate_operation_id())
 
             bound_logger.info(f"Starting {operation}")
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             try:
                 result = func(*args, **kwargs)
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 bound_logger.info(f"Completed {operation}", duration_seconds=round(duration, 3), success=True)
                 return result
 
             except Exception as e:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 bound_logger.error(
                     f"Failed {operation}",
                     duration_seconds=round(duration, 3),
@@ -98,27 +112,32 @@ def with_async_operation_context(operation: str, **context) -> Callable[[F], F]:
     """
 
     def decorator(func: F) -> F:
+        # Only the operation id differs between calls
+        base_logger = get_logger(func.__module__).bind(operation=operation, function=func.__name__, **context)
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            logger = get_logger(func.__module__)
-            operation_id = generate_operation_id()
+            # Below INFO only failures are logged; skip the id, timing and start/finish records
+            if not is_level_enabled(logging.INFO):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    base_logger.error(f"Failed {operation}", error=str(e), error_type=type(e).__name__, success=False)
+                    raise
 
-            # Bind operation context
-            bound_logger = logger.bind(
-                operation=operation, operation_id=operation_id, function=func.__name__, **context
-            )
+            bound_logger = base_logger.bind(operation_id=generate_operation_id())
 
             bound_logger.info(f"Starting {operation}")
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             try:
                 result = await func(*args, **kwargs)
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 bound_logger.info(f"Completed {operation}", duration_seconds=round(duration, 3), success=True)
                 return result
 
             except Exception as e:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 bound_logger.error(
                     f"Failed {operation}",
                     duration_seconds=round(duration, 3),
@@ -133,11 +152,13 @@ def with_async_operation_context(operation: str, **context) -> Callable[[F], F]:
     return decorator
 
 
-def log_api_call(api_name: str, **context) -> Callable[[F], F]:
+def log_api_call(api_name: str, url_arg: int | str | None = 0, **context) -> Callable[[F], F]:
     """Decorator to log API calls with request/response details.
 
     Args:
         api_name: Name of the API being called
+        url_arg: Position or keyword name of the URL argument to log; methods pass 1 to skip
+            ``self``, and None logs no URL
         **context: Additional context for the API call
 
     Returns:
@@ -145,27 +166,37 @@ def log_api_call(api_name: str, **context) -> Callable[[F], F]:
     """
 
     def decorator(func: F) -> F:
+        base_logger = get_logger(func.__module__).bind(api_name=api_name, **context)
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            logger = get_logger(func.__module__)
+            # Below INFO only failures are logged; skip the id, URL scan and timing
+            if not is_level_enabled(logging.INFO):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    base_logger.error(
+                        f"API call to {api_name} failed", error=str(e), error_type=type(e).__name__, success=False
+                    )
+                    raise
+
             call_id = generate_operation_id()
 
-            # Extract URL from function arguments if possible
-            url = None
-            if args:
-                for arg in args:
-                    if isinstance(arg, str) and (arg.startswith("http://") or arg.startswith("https://")):
-                        url = arg
-                        break
+            if isinstance(url_arg, int):
+                url = args[url_arg] if url_arg < len(args) else None
+            elif url_arg is not None:
+                url = kwargs.get(url_arg)
+            else:
+                url = None
 
-            bound_logger = logger.bind(api_name=api_name, call_id=call_id, url=url, **context)
+            bound_logger = base_logger.bind(call_id=call_id, url=url)
 
             bound_logger.debug(f"API call to {api_name}")
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             try:
                 result = await func(*args, **kwargs)
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
 
                 # Log successful API call
                 bound_logger.info(
@@ -174,7 +205,7 @@ def log_api_call(api_name: str, **context) -> Callable[[F], F]:
                 return result
 
             except Exception as e:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 bound_logger.error(
                     f"API call to {api_name} failed",
                     duration_seconds=round(duration, 3),
@@ -189,21 +220,54 @@ def log_api_call(api_name: str, **context) -> Callable[[F], F]:
     return decorator
 
 
-def log_extraction_step(step_name: str, npc_id: int | None = None) -> Callable[[F], F]:
+def _summarize_result(result: Any) -> dict[str, Any]:
+    """Default extraction step log fields: result length and NPC name when present."""
+    if result is None:
+        return {}
+
+    result_info = {}
+    if hasattr(result, "__len__"):
+        result_info["result_count"] = len(result)
+    if hasattr(result, "name"):
+        result_info["npc_name"] = result.name
+    elif isinstance(result, list) and result and hasattr(result[0], "name"):
+        result_info["npc_name"] = result[0].name
+    return result_info
+
+
+def log_extraction_step(
+    step_name: str,
+    npc_id: int | None = None,
+    summarize: Callable[[Any], dict[str, Any]] = _summarize_result,
+) -> Callable[[F], F]:
     """Decorator to log NPC extraction pipeline steps.
 
     Args:
         step_name: Name of the extraction step
         npc_id: NPC ID being processed (if known)
+        summarize: Builds extra completion log fields from the step result
 
     Returns:
         Decorated function with extraction step logging
     """
 
     def decorator(func: F) -> F:
+        base_logger = get_logger(func.__module__).bind(step=step_name, pipeline="npc_extraction")
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            logger = get_logger(func.__module__)
+            # Below INFO only failures are logged; skip the argument scan, timing and result summary
+            if not is_level_enabled(logging.INFO):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    base_logger.error(
+                        f"Failed extraction step: {step_name}",
+                        error=str(e),
+                        error_type=type(e).__name__,
+                        success=False,
+                    )
+                    raise
 
             # Try to extract npc_id from arguments if not provided
             actual_npc_id = npc_id
@@ -217,23 +281,17 @@ def log_extraction_step(step_name: str, npc_id: int | None = None) -> Callable[[
                 if actual_npc_id is None:
                     actual_npc_id = kwargs.get("id") or kwargs.get("npc_id")
 
-            bound_logger = logger.bind(step=step_name, npc_id=actual_npc_id, pipeline="npc_extraction")
+            bound_logger = base_logger.bind(npc_id=actual_npc_id)
 
             bound_logger.info(f"Starting extraction step: {step_name}")
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             try:
                 result = await func(*args, **kwargs)
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
 
                 # Log results info if available
-                result_info = {}
-                if hasattr(result, "__len__"):
-                    result_info["result_count"] = len(result)
-                if hasattr(result, "name"):
-                    result_info["npc_name"] = result.name
-                elif isinstance(result, list) and result and hasattr(result[0], "name"):
-                    result_info["npc_name"] = result[0].name
+                result_info = summarize(result)
 
                 bound_logger.info(
                     f"Completed extraction step: {step_name}",
@@ -244,7 +302,7 @@ def log_extraction_step(step_name: str, npc_id: int | None = None) -> Callable[[
                 return result
 
             except Exception as e:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 bound_logger.error(
                     f"Failed extraction step: {step_name}",
                     duration_seconds=round(duration, 3),
@@ -260,20 +318,28 @@ def log_extraction_step(step_name: str, npc_id: int | None = None) -> Callable[[
 
 
 class LogContext:
-    """Context manager for binding logger context."""
+    """Context manager that attaches context to every record logged inside it.
+
+    The context lives in a contextvar via loguru's contextualize(), so concurrent
+    asyncio tasks each see their own values and nested loggers inherit them.
+    """
 
     def __init__(self, logger_instance: Any, **context):
         self.logger = logger_instance
         self.context = context
-        self.bound_logger = None
+        self._contextualized: Any = None
 
     def __enter__(self) -> Any:
-        self.bound_logger = self.logger.bind(**self.context)
-        return self.bound_logger
+        self._contextualized = logger.contextualize(**self.context)
+        self._contextualized.__enter__()
+        return self.logger
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if exc_type is not None and self.bound_logger is not None:
-            self.bound_logger.error("Context operation failed", error=str(exc_val), error_type=exc_type.__name__)
+        try:
+            if exc_type is not None:
+                self.logger.error("Context operation failed", error=str(exc_val), error_type=exc_type.__name__)
+        finally:
+            self._contextualized.__exit__(exc_type, exc_val, exc_tb)
 
 
 def with_npc_context(npc_id: int) -> LogContext:
@@ -2,13 +2,15 @@
 # ABOUTME: Leverages tenacity's built-in features for exponential backoff and circuit breaking
 
 import asyncio
+import re
+import threading
 import time
 from collections.abc import Callable
 from contextlib import asynccontextmanager
 from typing import Any, TypeVar
 
 from tenacity import (
-    AsyncRetrying,
+    retry,
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
@@ -71,13 +73,13 @@ def _circuit_breaker_stop(retry_state):
     """Tenacity stop condition that implements circuit breaker logic."""
     global _circuit_breaker_state
 
-    current_time = time.time()
+    current_time = time.monotonic()
     state = _circuit_breaker_state
 
     # Check if circuit breaker should reset
     if (
         state["is_open"]
-        and state["last_failure_time"]
+        and state["last_failure_time"] is not None
         and current_time - state["last_failure_time"] >= state["timeout"]
     ):
         state["is_open"] = False
@@ -102,43 +104,74 @@ def _circuit_breaker_stop(retry_state):
     return False  # Continue retrying
 
 
-# Global rate limiter state
-_rate_limiter_state = {
-    "calls_per_second": 1.0,
-    "last_call_time": 0.0,
-}
-
-
-async def _apply_rate_limiting():
-    """Apply rate limiting using simple async sleep."""
-    state = _rate_limiter_state
-
-    if state["calls_per_second"] <= 0:
-        return
-
-    min_interval = 1.0 / state["calls_per_second"]
-    current_time = time.time()
-    time_since_last = current_time - state["last_call_time"]
+def _circuit_breaker_success() -> None:
+    """Clear failures after a successful call; the steady state writes nothing."""
+    state = _circuit_breaker_state
+    if state["is_open"]:
+        logger.info("Circuit breaker reset after successful request")
+    if state["failure_count"] or state["is_open"]:
+        state["failure_count"] = 0
+        state["is_open"] = False
 
-    if time_since_last < min_interval:
-        sleep_time = min_interval - time_since_last
-        logger.debug("Rate limiting", sleep_time=sleep_time)
-        await asyncio.sleep(sleep_time)
 
-    state["last_call_time"] = time.time()
+class _RateLimiter:
+    """Spaces LLM calls at least 1 / calls_per_second apart."""
+
+    def __init__(self, calls_per_second: float = 1.0):
+        self.set_rate(calls_per_second)
+        self.last_call_time = 0.0
+        # Guards only the slot reservation, never a sleep, so it is safe across event loops
+        self._lock = threading.Lock()
+
+    def set_rate(self, calls_per_second: float) -> None:
+        """Change the rate in place so every decorated function sees it."""
+        self.calls_per_second = calls_per_second
+        # A non-positive rate disables limiting
+        self.min_interval = 1.0 / calls_per_second if calls_per_second > 0 else 0.0
+
+    async def acquire(self) -> None:
+        """Claim the next free call slot, then wait until it arrives."""
+        if self.min_interval <= 0:
+            return
+
+        with self._lock:
+            current_time = time.monotonic()
+            slot = max(current_time, self.last_call_time + self.min_interval)
+            self.last_call_time = slot
+        sleep_time = slot - current_time
+        if sleep_time > 0:
+            logger.debug("Rate limiting", sleep_time=sleep_time)
+            await asyncio.sleep(sleep_time)
+
+
+# Global rate limiter shared by every llm_retry-decorated function
+_rate_limiter = _RateLimiter()
+
+
+# Error message categories, tried in priority order: each branch looks ahead over the whole message
+_ERROR_CATEGORY = re.compile(
+    r"^(?:"
+    r"(?=.*?(?:rate limit|429))(?P<rate_limit>)"
+    r"|(?=.*?(?:quota|billing))(?P<quota>)"
+    r"|(?=.*?timeout)(?P<timeout>)"
+    r"|(?=.*?(?:connection|network))(?P<connection>)"
+    r")",
+    re.IGNORECASE | re.DOTALL,
+)
 
 
 def _convert_exception(e: Exception) -> Exception:
     """Convert generic exceptions to LLM-specific ones for better handling."""
-    error_str = str(e).lower()
+    match = _ERROR_CATEGORY.match(str(e))
+    category = match.lastgroup if match else None
 
-    if "rate limit" in error_str or "429" in error_str:
+    if category == "rate_limit":
         return LLMRateLimitError(f"Rate limit exceeded: {e}")
-    elif "quota" in error_str or "billing" in error_str:
+    elif category == "quota":
         return LLMQuotaExceededError(f"API quota exceeded: {e}")
-    elif "timeout" in error_str:
+    elif category == "timeout":
         return LLMTimeoutError(f"Request timeout: {e}")
-    elif "connection" in error_str or "network" in error_str:
+    elif category == "connection":
         return LLMConnectionError(f"Connection failed: {e}")
     else:
         return LLMAPIError(f"LLM API call failed: {e}")
@@ -155,46 +188,45 @@ def llm_retry(
     """Simplified LLM retry decorator using tenacity."""
 
     def decorator(func: Callable):
+        # Configure retry strategy once; tenacity copies its controller for each call
+        retry_kwargs = {
+            "stop": stop_after_attempt(max_attempts),
+            "wait": wait_exponential(multiplier=multiplier, min=min_wait, max=max_wait),
+            "retry": retry_if_exception_type(
+                (
+                    LLMRateLimitError,
+                    LLMTimeoutError,
+                    LLMConnectionError,
+                )
+            ),
+            "reraise": True,
+        }
+
+        # Add circuit breaker if enabled
+        if with_circuit_breaker:
+            retry_kwargs["stop"] = _circuit_breaker_stop
+
+        @retry(**retry_kwargs)
+        async def call_with_retry(*args, **kwargs):
+            try:
+                result = await func(*args, **kwargs)
+            except LLMAPIError:
+                # Already typed (every LLM error subclasses LLMAPIError); skip classification
+                raise
+            except Exception as e:
+                # Convert generic exceptions to LLM-specific ones
+                raise _convert_exception(e) from e
+
+            if with_circuit_breaker:
+                _circuit_breaker_success()
+            return result
+
         async def wrapper(*args, **kwargs):
-            # Apply rate limiting before each attempt
+            # Apply rate limiting before the retried call
             if with_rate_limiting:
-                await _apply_rate_limiting()
-
-            # Configure retry strategy
-            retry_kwargs = {
-                "stop": stop_after_attempt(max_attempts),
-                "wait": wait_exponential(multiplier=multiplier, min=min_wait, max=max_wait),
-                "retry": retry_if_exception_type(
-                    (
-                        LLMRateLimitError,
-                        LLMTimeoutError,
-                        LLMConnectionError,
-                    )
-                ),
-                "reraise": True,
-            }
-
-            # Add circuit breaker if enabled
-            if with_circuit_breaker:
-                retry_kwargs["stop"] = _circuit_breaker_stop
-
-            async for attempt in AsyncRetrying(**retry_kwargs):
-                with attempt:
-                    try:
-                        return await func(*args, **kwargs)
-                    except (
-                        LLMAPIError,
-                        LLMRateLimitError,
-                        LLMTimeoutError,
-                        LLMConnectionError,
-                        LLMQuotaExceededError,
-                        CircuitBreakerOpen,
-                    ) as e:
-                        # Already an LLM-specific exception, re-raise as-is
-                        raise e
-                    except Exception as e:
-                        # Convert generic exceptions to LLM-specific ones
-                        raise _convert_exception(e) from e
+                await _rate_limiter.acquire()
+
+            return await call_with_retry(*args, **kwargs)
 
         return wrapper
 
@@ -204,15 +236,14 @@ def llm_retry(
 @asynccontextmanager
 async def llm_batch_context(calls_per_second: float = 2.0):
     """Context manager for batch LLM operations with higher rate limits."""
-    global _rate_limiter_state
-    original_rate = _rate_limiter_state["calls_per_second"]
+    original_rate = _rate_limiter.calls_per_second
 
     try:
-        _rate_limiter_state["calls_per_second"] = calls_per_second
+        _rate_limiter.set_rate(calls_per_second)
         logger.info("Batch LLM context started", calls_per_second=calls_per_second)
         yield
     finally:
-        _rate_limiter_state["calls_per_second"] = original_rate
+        _rate_limiter.set_rate(original_rate)
         logger.info("Batch LLM context ended")
 
 
@@ -220,9 +251,9 @@ def configure_llm_retry(
     rate_limit: float = 1.0, circuit_breaker_threshold: int = 3, circuit_breaker_timeout: float = 30.0
 ):
     """Configure global LLM retry settings."""
-    global _rate_limiter_state, _circuit_breaker_state
+    global _circuit_breaker_state
 
-    _rate_limiter_state["calls_per_second"] = rate_limit
+    _rate_limiter.set_rate(rate_limit)
     _circuit_breaker_state.update(
         {
             "threshold": circuit_breaker_threshold,
@@ -239,8 +270,8 @@ def get_llm_retry_status() -> dict[str, Any]:
     """Get current status of LLM retry mechanisms."""
     return {
         "rate_limiter": {
-            "calls_per_second": _rate_limiter_state["calls_per_second"],
-            "last_call_time": _rate_limiter_state["last_call_time"],
+            "calls_per_second": _rate_limiter.calls_per_second,
+            "last_call_time": _rate_limiter.last_call_time,
         },
         "circuit_breaker": {
             "is_open": _circuit_breaker_state["is_open"],
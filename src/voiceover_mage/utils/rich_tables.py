@@ -1,6 +1,8 @@
 # ABOUTME: Beautiful rich table utilities to replace tabulate with styled, colorful displays
 # ABOUTME: Provides pre-configured table generators for common data display patterns
 
+import os
+from collections.abc import Mapping
 from typing import Any
 
 from rich.box import ROUNDED, SIMPLE
@@ -222,7 +224,13 @@ def create_voice_samples_table(samples: list[Any], npc_id: int) -> Table:
 
     rows = []
     for s in samples:
-        size_kb = f"{(len(s.audio_bytes) / 1024):.1f}" if s.audio_bytes else "0.0"
+        if s.audio_bytes:
+            size_bytes = len(s.audio_bytes)
+        elif s.audio_path and os.path.exists(s.audio_path):
+            size_bytes = os.path.getsize(s.audio_path)
+        else:
+            size_bytes = 0
+        size_kb = f"{(size_bytes / 1024):.1f}"
         prompt_short = (s.voice_prompt[:60] + "...") if len(s.voice_prompt) > 60 else s.voice_prompt
 
         # Style the representative column
@@ -248,7 +256,7 @@ def create_voice_samples_table(samples: list[Any], npc_id: int) -> Table:
     )
 
 
-def create_logging_status_table(status: dict[str, Any]) -> Table:
+def create_logging_status_table(status: Mapping[str, Any]) -> Table:
     """Create a logging configuration status table.
 
     Args:
@@ -289,9 +297,10 @@ def create_pipeline_summary_table(extraction: Any) -> Table:
     Returns:
         Beautiful pipeline summary table
     """
+    completed_stages = extraction.completed_stages
     summary_data = {
         "🆔 NPC": f"{extraction.id} - {extraction.npc_name}",
-        "📊 Completed Stages": ", ".join(extraction.completed_stages) if extraction.completed_stages else "None",
+        "📊 Completed Stages": ", ".join(completed_stages) if completed_stages else "None",
         "✅ Success": "Yes" if extraction.extraction_success else "No",
     }
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 from collections.abc import AsyncGenerator
 from datetime import UTC, datetime
+from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -29,6 +30,7 @@ async def temp_db() -> AsyncGenerator[DatabaseManager]:
 
     db = DatabaseManager("sqlite+aiosqlite:///:memory:")
     db.engine = engine
+    db.read_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
     db.async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
     await db.create_tables()
     yield db
@@ -59,21 +61,6 @@ async def _seed_raw_state(db: DatabaseManager, npc_id: int) -> NPCPipelineState:
     return state
 
 
-class _BinarySink:
-    def write(self, *_):
-        return None
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc, tb):
-        return False
-
-
-def _binary_open(*_args, **_kwargs):
-    return _BinarySink()
-
-
 @pytest.mark.asyncio
 async def test_run_full_pipeline_with_mocked_dependencies(temp_db: DatabaseManager):
     pipeline = UnifiedPipelineService(database=temp_db, force_refresh=True, api_key=None)
@@ -114,9 +101,9 @@ async def test_run_full_pipeline_with_mocked_dependencies(temp_db: DatabaseManag
     )
     pipeline.voice_service.generate_preview_audio = AsyncMock(return_value=[b"audio-bytes"])
 
-    with (
-        patch("pathlib.Path.mkdir", return_value=None),
-        patch("builtins.open", _binary_open),
+    with patch(
+        "voiceover_mage.core.unified_pipeline.store_audio",
+        return_value=Path("data/voice_previews/abc.mp3"),
     ):
         state = await pipeline.run_full_pipeline(101)
 
@@ -129,6 +116,8 @@ async def test_run_full_pipeline_with_mocked_dependencies(temp_db: DatabaseManag
     previews = await temp_db.list_voice_previews(101)
     assert len(previews) == 1
     assert previews[0].voice_prompt == "warm voice"
+    assert previews[0].audio_path == str(Path("data/voice_previews/abc.mp3"))
+    assert previews[0].audio_bytes is None
 
     stage_map = await temp_db.compute_stage_map(101)
     assert stage_map["wiki_data"] and stage_map["character_profile"]
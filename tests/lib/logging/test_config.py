@@ -1,21 +1,46 @@
 # ABOUTME: Tests for logging configuration module
 # ABOUTME: Validates dual-mode logging setup and third-party library suppression
 
+import io
+import json
 import logging
 import os
+import sys
 import tempfile
+import threading
+import time
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
+import pytest
+from loguru import logger
+
+from voiceover_mage.utils.logging import config
 from voiceover_mage.utils.logging.config import (
+    BackgroundFileSink,
     LoggingMode,
+    SizeRotation,
     configure_logging,
     detect_logging_mode,
     get_logging_status,
+    is_level_enabled,
+    json_format,
     suppress_library_output,
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_logging(tmp_path, monkeypatch):
+    """Run each test in its own directory and drop any sinks it installed afterwards."""
+    monkeypatch.chdir(tmp_path)
+    yield
+    logger.remove()
+    logger.add(sys.stderr)
+    config._active_sinks = None
+
+
 class TestLoggingMode:
     """Test the LoggingMode constants."""
 
@@ -99,6 +124,7 @@ class TestConfigureLogging:
 
         # Reset warnings capture
         logging.captureWarnings(False)
+        config._third_party_configured = False
 
     def test_configure_interactive_mode(self):
         """Test configuration of interactive mode logging."""
@@ -131,6 +157,78 @@ class TestConfigureLogging:
         root_logger = logging.getLogger()
         assert root_logger.level == logging.DEBUG
 
+    def test_is_level_enabled_follows_configured_level(self):
+        """Test that the level check tracks the configured log level."""
+        configure_logging(mode=LoggingMode.PRODUCTION, log_level="WARNING")
+        assert not is_level_enabled(logging.INFO)
+        assert is_level_enabled(logging.ERROR)
+
+        configure_logging(mode=LoggingMode.PRODUCTION, log_level="DEBUG")
+        assert is_level_enabled(logging.INFO)
+
+    def test_reconfigure_after_external_remove(self):
+        """Test that identical reconfiguration reinstalls sinks someone else removed."""
+        stream = io.StringIO()
+        with patch("sys.stdout", stream):
+            configure_logging(mode=LoggingMode.PRODUCTION, log_level="INFO")
+            logger.remove()
+            configure_logging(mode=LoggingMode.PRODUCTION, log_level="INFO")
+            logger.info("after")
+            logger.remove()
+
+        assert json.loads(stream.getvalue())["message"] == "after"
+
+    def test_production_sink_renders_unpicklable_extra(self):
+        """Test that bound values which cannot be pickled still reach stdout as JSON."""
+        stream = io.StringIO()
+        config._active_sinks = None
+        try:
+            with patch("sys.stdout", stream):
+                configure_logging(mode=LoggingMode.PRODUCTION, log_level="INFO")
+                logger.bind(lock=threading.Lock()).info("bound")
+        finally:
+            config._active_sinks = None
+            logger.remove()
+
+        line = json.loads(stream.getvalue())
+        assert line["message"] == "bound"
+        assert "lock" in line["extra"]["lock"]
+
+    def test_production_sink_does_not_block_on_stdout(self):
+        """Test that logging returns while the stdout write is still pending."""
+        release = threading.Event()
+
+        class SlowStream(io.StringIO):
+            def write(self, text):
+                release.wait(timeout=5)
+                return super().write(text)
+
+        stream = SlowStream()
+        with patch("sys.stdout", stream):
+            configure_logging(mode=LoggingMode.PRODUCTION, log_level="INFO")
+            logger.info("queued")
+            assert stream.getvalue() == ""
+            release.set()
+            logger.remove()
+
+        assert json.loads(stream.getvalue())["message"] == "queued"
+
+    def test_file_sinks_render_unpicklable_extra(self):
+        """Test that bound values which cannot be pickled still reach the log files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.chdir(temp_dir)
+            config._active_sinks = None
+            try:
+                configure_logging(mode=LoggingMode.INTERACTIVE, log_level="INFO")
+                logger.bind(lock=threading.Lock()).info("bound")
+            finally:
+                config._active_sinks = None
+                logger.remove()
+
+            assert "bound" in Path(config.LOG_FILES["main"]).read_text()
+            line = json.loads(Path(config.LOG_FILES["json"]).read_text())
+            assert "lock" in line["extra"]["lock"]
+
     def test_configure_custom_log_file(self):
         """Test configuration with custom log file."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -176,6 +274,20 @@ class TestSuppressLibraryOutput:
         # stdout should still be restored after exception
         assert sys.stdout == original_stdout
 
+    def test_suppress_output_nested(self):
+        """Test that nested suppression restores the original streams."""
+        import sys
+
+        original_stdout = sys.stdout
+
+        with suppress_library_output():
+            suppressed = sys.stdout
+            with suppress_library_output():
+                assert sys.stdout is suppressed
+            assert sys.stdout is suppressed
+
+        assert sys.stdout == original_stdout
+
 
 class TestGetLoggingStatus:
     """Test logging status reporting."""
@@ -217,6 +329,10 @@ class TestGetLoggingStatus:
 class TestThirdPartyLogging:
     """Test third-party library logging configuration."""
 
+    def setup_method(self):
+        """Let each test apply the third-party levels afresh."""
+        config._third_party_configured = False
+
     def test_third_party_loggers_suppressed(self):
         """Test that third-party loggers are properly suppressed."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -255,3 +371,125 @@ class TestThirdPartyLogging:
 
             warnings_logger = logging.getLogger("py.warnings")
             assert warnings_logger.level == logging.ERROR
+
+    def test_setup_runs_once(self):
+        """Test that repeat calls skip reapplying the third-party levels."""
+        config.setup_third_party_logging()
+        logging.getLogger("httpx").setLevel(logging.DEBUG)
+        try:
+            config.setup_third_party_logging()
+            assert logging.getLogger("httpx").level == logging.DEBUG
+        finally:
+            logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+class TestJsonFormat:
+    """Test the JSON line formatter."""
+
+    def test_exception_includes_traceback(self):
+        """Test that logged exceptions keep their formatted traceback."""
+        try:
+            raise ValueError("boom")
+        except ValueError as error:
+            exception = SimpleNamespace(type=ValueError, value=error, traceback=error.__traceback__)
+        record = {
+            "time": datetime.now(UTC),
+            "level": SimpleNamespace(name="ERROR"),
+            "name": __name__,
+            "function": "test_exception_includes_traceback",
+            "line": 1,
+            "message": "failed",
+            "extra": {},
+            "exception": exception,
+        }
+
+        assert json_format(record) == "{extra[_json]}\n"
+        payload = json.loads(record["extra"]["_json"])["exception"]
+        assert payload["type"] == "ValueError"
+        assert payload["value"] == "boom"
+        assert "Traceback (most recent call last)" in payload["traceback"]
+        assert 'raise ValueError("boom")' in payload["traceback"]
+
+
+def _wait_for(condition, timeout: float = 5.0) -> bool:
+    """Poll until a background writer has caught up."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class TestBackgroundFileSink:
+    """Test the threaded log file sink."""
+
+    def test_buffered_lines_flush_on_error(self, tmp_path):
+        """Test that an error record pushes the buffered lines to disk straight away."""
+        path = tmp_path / "app.json"
+        sink_id = logger.add(
+            BackgroundFileSink(path, buffering=64 * 1024, flush_level=logging.ERROR),
+            format="{level} {message}",
+        )
+        try:
+            logger.info("first")
+            logger.error("failed")
+            assert _wait_for(lambda: "ERROR failed" in path.read_text())
+            assert "INFO first" in path.read_text()
+        finally:
+            logger.remove(sink_id)
+
+    def test_buffered_lines_flush_on_remove(self, tmp_path):
+        """Test that removing the sink writes out whatever is still buffered."""
+        path = tmp_path / "app.json"
+        sink_id = logger.add(BackgroundFileSink(path, buffering=64 * 1024, flush_level=logging.ERROR))
+        logger.info("pending")
+        logger.remove(sink_id)
+
+        assert "pending" in path.read_text()
+
+    def test_rotation_and_retention(self, tmp_path):
+        """Test that a full file is rotated aside and expired rotations are deleted."""
+        path = tmp_path / "app.log"
+        expired = tmp_path / "app.2000-01-01_00-00-00_000000.log"
+        expired.write_text("old\n")
+        os.utime(expired, (0, 0))
+
+        sink_id = logger.add(
+            BackgroundFileSink(path, rotation=SizeRotation(limit=15), retention=timedelta(days=7)),
+            format="{message}",
+        )
+        logger.info("0123456789")
+        assert _wait_for(lambda: path.exists() and path.stat().st_size > 0)
+        logger.info("abcdefghij")
+        logger.remove(sink_id)
+
+        rotated = [p for p in tmp_path.glob("app.*.log") if p != expired]
+        assert not expired.exists()
+        assert [p.read_text() for p in rotated] == ["0123456789\n"]
+        assert path.read_text() == "abcdefghij\n"
+
+
+class TestSizeRotation:
+    """Test the in-memory size rotation check."""
+
+    def test_rotates_when_limit_exceeded(self):
+        """Test that rotation triggers once the tracked size passes the limit."""
+        import io
+
+        existing = io.StringIO("x" * 6)
+        rotation = SizeRotation(limit=10)
+
+        assert rotation("abc", existing) is False
+        assert rotation("abc", existing) is True
+        assert rotation("abcdefg", existing) is False
+        assert rotation("a", existing) is True
+
+    def test_counts_encoded_bytes(self):
+        """Test that multi-byte characters count toward the limit by their UTF-8 size."""
+        import io
+
+        rotation = SizeRotation(limit=10)
+
+        assert rotation("é" * 5, io.StringIO()) is False
+        assert rotation("é", io.StringIO()) is True
@@ -1,13 +1,10 @@
 # ABOUTME: Tests for simplified progress tracking functionality
-# ABOUTME: Validates create_smart_progress function and basic tracker
+# ABOUTME: Validates create_smart_progress function and its Progress context manager
 
 from rich.console import Console
 from rich.progress import Progress
 
-from voiceover_mage.utils.logging.progress import (
-    SimpleProgressTracker,
-    create_smart_progress,
-)
+from voiceover_mage.utils.logging.progress import create_smart_progress
 
 
 class TestCreateSmartProgress:
@@ -18,27 +15,25 @@ class TestCreateSmartProgress:
         console = Console()
         initial_description = "🔍 Testing..."
 
-        progress, task_id, tracker = create_smart_progress(console, initial_description)
+        progress, task_id = create_smart_progress(console, initial_description)
 
         assert isinstance(progress, Progress)
         assert task_id is not None
-        assert isinstance(tracker, SimpleProgressTracker)
-        assert tracker.progress == progress
-        assert tracker.task_id == task_id
+        assert progress.tasks[0].description == initial_description
 
     def test_create_smart_progress_default_description(self):
         """Test creation with default description."""
         console = Console()
 
-        progress, task_id, tracker = create_smart_progress(console)
+        progress, task_id = create_smart_progress(console)
 
         assert isinstance(progress, Progress)
-        assert isinstance(tracker, SimpleProgressTracker)
+        assert task_id is not None
 
     def test_context_manager(self):
-        """Test tracker as context manager."""
+        """Test the progress itself as context manager."""
         console = Console()
-        progress, task_id, tracker = create_smart_progress(console)
+        progress, task_id = create_smart_progress(console)
 
-        with tracker as ctx_tracker:
-            assert ctx_tracker == tracker
+        with progress as ctx_progress:
+            assert ctx_progress is progress
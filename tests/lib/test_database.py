@@ -13,7 +13,7 @@ from sqlalchemy.pool import StaticPool
 from voiceover_mage.extraction.analysis.image import NPCVisualCharacteristics
 from voiceover_mage.extraction.analysis.synthesizer import NPCDetails
 from voiceover_mage.extraction.analysis.text import NPCTextCharacteristics
-from voiceover_mage.persistence.manager import DatabaseManager, NPCPipelineState
+from voiceover_mage.persistence.manager import DatabaseManager, NPCPipelineState, reset_engines
 
 
 @pytest_asyncio.fixture
@@ -30,6 +30,7 @@ async def temp_db() -> AsyncGenerator[DatabaseManager]:
 
     db = DatabaseManager("sqlite+aiosqlite:///:memory:")
     db.engine = engine
+    db.read_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
     db.async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
     await db.create_tables()
     yield db
@@ -89,6 +90,29 @@ async def test_wiki_snapshot_round_trip(temp_db: DatabaseManager):
     assert state.completed_stages == ["wiki_data"]
 
 
+@pytest.mark.asyncio
+async def test_wiki_snapshot_unchanged_checksum_only_refreshes_fetch_time(temp_db: DatabaseManager):
+    state = await _bootstrap_npc(temp_db, npc_id=43)
+    later = datetime(2030, 1, 1, tzinfo=UTC)
+
+    await temp_db.upsert_wiki_snapshot(
+        npc_id=state.id,
+        raw_markdown="ignored because the checksum matches",
+        chathead_image_url=None,
+        image_url=None,
+        raw_data=None,
+        source_checksum="abc123",
+        fetched_at=later,
+    )
+
+    refreshed = await temp_db.get_cached_extraction(state.id)
+    assert refreshed is not None
+    assert refreshed.raw_markdown == state.raw_markdown
+    assert refreshed.chathead_image_url == state.chathead_image_url
+    assert refreshed.fetched_at is not None
+    assert refreshed.fetched_at.replace(tzinfo=UTC) == later
+
+
 @pytest.mark.asyncio
 async def test_character_profile_upsert(temp_db: DatabaseManager):
     state = await _bootstrap_npc(temp_db)
@@ -155,6 +179,25 @@ async def test_character_profile_upsert(temp_db: DatabaseManager):
     assert refreshed.visual_analysis is not None
     assert refreshed.stage_flags["character_profile"] is True
 
+    stored = await temp_db.upsert_character_profile(
+        npc_id=state.id,
+        profile=profile.model_copy(update={"occupation": "Head servant"}),
+        pipeline_version="test-2",
+    )
+    # The returned row is the stored one, decoded back through the JSON columns
+    assert stored.npc_id == state.id
+    assert isinstance(stored.profile_json, NPCDetails)
+    assert stored.profile_json.occupation == "Head servant"
+    assert stored.text_analysis_json is None
+    assert stored.pipeline_version == "test-2"
+
+    updated = await temp_db.get_cached_extraction(state.id)
+    assert updated is not None
+    assert updated.character_profile is not None
+    assert updated.character_profile.occupation == "Head servant"
+    assert updated.pipeline_version == "test-2"
+    assert updated.text_analysis is None
+
 
 @pytest.mark.asyncio
 async def test_voice_preview_selection(temp_db: DatabaseManager):
@@ -185,6 +228,7 @@ async def test_voice_preview_selection(temp_db: DatabaseManager):
     assert second.is_representative is True
 
     assert first.id is not None
+    assert await temp_db.set_selected_voice_preview(state.id + 1, first.id) is None
     selected = await temp_db.set_selected_voice_preview(state.id, first.id)
     assert selected is not None
     assert selected.is_representative is True
@@ -192,6 +236,7 @@ async def test_voice_preview_selection(temp_db: DatabaseManager):
     refreshed = await temp_db.get_cached_extraction(state.id)
     assert refreshed is not None
     assert refreshed.selected_preview_id == first.id
+    assert [p.id for p in refreshed.voice_previews if p.is_representative] == [first.id]
     assert refreshed.stage_flags["voice_generation"] is True
     assert refreshed.stage_flags["voice_selection"] is True
 
@@ -299,3 +344,244 @@ async def test_clear_cache(temp_db: DatabaseManager):
 
     cached = await temp_db.get_cached_extraction(33)
     assert cached is None
+
+
+@pytest.mark.asyncio
+async def test_managers_share_engine_per_url():
+    await reset_engines()
+    try:
+        first = DatabaseManager("sqlite+aiosqlite:///:memory:")
+        second = DatabaseManager("sqlite+aiosqlite:///:memory:")
+        assert first.engine is second.engine
+    finally:
+        await reset_engines()
+
+
+@pytest.mark.asyncio
+async def test_closing_one_manager_keeps_shared_engine_open():
+    await reset_engines()
+    try:
+        first = DatabaseManager("sqlite+aiosqlite:///:memory:")
+        second = DatabaseManager("sqlite+aiosqlite:///:memory:")
+        await second.create_tables()
+        await _bootstrap_npc(second, npc_id=12)
+
+        # Disposing the shared in-memory engine would drop the database
+        await first.close()
+        await first.close()
+        assert await second.get_npc_name(12) == "Hans"
+
+        await second.close()
+        assert DatabaseManager("sqlite+aiosqlite:///:memory:").engine is not second.engine
+    finally:
+        await reset_engines()
+
+
+@pytest.mark.asyncio
+async def test_create_voice_previews_batch(temp_db: DatabaseManager):
+    state = await _bootstrap_npc(temp_db, npc_id=21)
+    base = {"voice_prompt": "gruff", "sample_text": "Move along.", "provider": "elevenlabs", "model": "eleven_ttv_v3"}
+
+    created = await temp_db.create_voice_previews(
+        state.id,
+        [
+            {**base, "generation_metadata": {"index": 1}},
+            {**base, "generation_metadata": {"index": 2}, "is_representative": True},
+            {**base, "generation_metadata": {"index": 3}},
+        ],
+    )
+
+    assert [p.generation_metadata["index"] for p in created] == [1, 2, 3]
+    assert all(p.id is not None for p in created)
+    assert await temp_db.create_voice_previews(state.id, []) == []
+
+    refreshed = await temp_db.get_cached_extraction(state.id)
+    assert refreshed is not None
+    assert len(refreshed.voice_previews) == 3
+    assert refreshed.selected_preview_id == created[1].id
+
+
+@pytest.mark.asyncio
+async def test_preview_audio_loaded_only_by_listing(temp_db: DatabaseManager):
+    from sqlalchemy import inspect
+
+    state = await _bootstrap_npc(temp_db, npc_id=33)
+    created = await temp_db.create_voice_preview(
+        npc_id=state.id,
+        voice_prompt="hoarse",
+        sample_text="Buy my wares.",
+        provider="elevenlabs",
+        model="eleven_ttv_v3",
+        audio_bytes=b"mp3-bytes",
+    )
+    assert created.id is not None
+
+    [listed] = await temp_db.list_voice_previews(state.id)
+    assert listed.audio_bytes == b"mp3-bytes"
+
+    # The state and selection results carry preview metadata only
+    refreshed = await temp_db.get_cached_extraction(state.id)
+    assert refreshed is not None
+    [cached] = refreshed.voice_previews
+    assert "audio_bytes" in inspect(cached).unloaded
+    selected = await temp_db.set_selected_voice_preview(state.id, created.id)
+    assert selected is not None
+    assert "audio_bytes" in inspect(selected).unloaded
+
+
+def test_pipeline_state_reflects_later_changes():
+    from voiceover_mage.persistence.models import NPC, WikiSnapshot
+
+    npc = NPC(id=1, name="Bob", wiki_url="https://example.com/Bob")
+    state = NPCPipelineState(npc=npc)
+    assert state.raw_markdown == ""
+
+    npc.name = "Bob the Smith"
+    state.wiki_snapshot = WikiSnapshot(npc_id=1, raw_markdown="# Bob")
+
+    assert state.npc_name == "Bob the Smith"
+    assert state.raw_markdown == "# Bob"
+    assert state.extraction_success
+
+
+def test_character_profile_upsert_compiles_for_postgresql():
+    from sqlalchemy.dialects import postgresql
+
+    from voiceover_mage.persistence.manager import _character_profile_upsert
+
+    values = {"npc_id": 1, "profile_json": None, "pipeline_version": "v1"}
+    sql = str(_character_profile_upsert("postgresql", values).compile(dialect=postgresql.dialect()))
+
+    assert "ON CONFLICT (npc_id) DO UPDATE" in sql
+    assert "RETURNING" in sql
+    with pytest.raises(NotImplementedError):
+        _character_profile_upsert("mssql", values)
+
+
+@pytest.mark.asyncio
+async def test_get_npc_name(temp_db: DatabaseManager):
+    await _bootstrap_npc(temp_db, npc_id=64)
+
+    assert await temp_db.get_npc_name(64) == "Hans"
+    assert await temp_db.get_npc_name(65) is None
+
+
+# Tables as created by the original schema: created_at is NOT NULL with no server default.
+_LEGACY_PREVIEW_TABLES = (
+    """
+    CREATE TABLE voice_preview (
+        id INTEGER NOT NULL PRIMARY KEY,
+        npc_id INTEGER NOT NULL REFERENCES npc (id),
+        voice_prompt VARCHAR NOT NULL,
+        sample_text VARCHAR NOT NULL,
+        provider VARCHAR NOT NULL,
+        model VARCHAR NOT NULL,
+        generation_metadata JSON,
+        audio_path VARCHAR,
+        audio_bytes BLOB,
+        is_representative BOOLEAN NOT NULL,
+        created_at DATETIME NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE audio_transcript (
+        id INTEGER NOT NULL PRIMARY KEY,
+        npc_id INTEGER NOT NULL REFERENCES npc (id),
+        preview_id INTEGER NOT NULL REFERENCES voice_preview (id),
+        provider VARCHAR NOT NULL,
+        text VARCHAR NOT NULL,
+        metadata_json JSON,
+        created_at DATETIME NOT NULL
+    )
+    """,
+)
+
+
+@pytest.mark.asyncio
+async def test_preview_inserts_work_on_legacy_tables():
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        for ddl in _LEGACY_PREVIEW_TABLES:
+            await conn.execute(text(ddl))
+
+    db = DatabaseManager("sqlite+aiosqlite:///:memory:")
+    db.engine = engine
+    db.read_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+    db.async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        await db.create_tables()
+        state = await _bootstrap_npc(db, npc_id=7)
+        base = {"voice_prompt": "wry", "sample_text": "Well met.", "provider": "elevenlabs", "model": "eleven_ttv_v3"}
+
+        single = await db.create_voice_preview(npc_id=state.id, **base)
+        batch = await db.create_voice_previews(state.id, [base, base])
+        assert single.id is not None
+        transcript = await db.save_audio_transcript(
+            npc_id=state.id,
+            preview_id=single.id,
+            provider="whisper",
+            text="Well met.",
+        )
+
+        assert transcript.created_at is not None
+        previews = await db.list_voice_previews(state.id)
+        assert {p.id for p in previews} == {single.id, *(p.id for p in batch)}
+        assert all(p.created_at is not None for p in previews)
+    finally:
+        await db.close()
+
+
+def test_index_ddl_compiles_for_postgresql():
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.schema import CreateIndex
+    from sqlmodel import SQLModel
+
+    indexes = [index for table in SQLModel.metadata.tables.values() for index in table.indexes]
+    assert indexes
+    for index in indexes:
+        sql = str(CreateIndex(index, if_not_exists=True).compile(dialect=postgresql.dialect()))
+        assert sql.startswith("CREATE INDEX IF NOT EXISTS")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("if_not_exists", [True, False], ids=["if-not-exists", "checkfirst"])
+async def test_create_tables_adds_indexes_to_legacy_tables(monkeypatch, if_not_exists: bool):
+    from sqlalchemy import inspect, text
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        for ddl in _LEGACY_PREVIEW_TABLES:
+            await conn.execute(text(ddl))
+
+    if not if_not_exists:
+        monkeypatch.setattr("voiceover_mage.persistence.manager._IF_NOT_EXISTS_INDEX_DIALECTS", frozenset())
+
+    db = DatabaseManager("sqlite+aiosqlite:///:memory:")
+    db.engine = engine
+    try:
+        await db.create_tables()
+        await db.create_tables()  # Existing indexes are left alone
+
+        def index_names(sync_conn, table: str) -> set[str]:
+            return {index["name"] for index in inspect(sync_conn).get_indexes(table)}
+
+        async with engine.connect() as conn:
+            preview_indexes = await conn.run_sync(index_names, "voice_preview")
+            transcript_indexes = await conn.run_sync(index_names, "audio_transcript")
+        assert {"ix_voice_preview_npc_rep", "ix_voice_preview_npc_created"} <= preview_indexes
+        assert "ix_audio_transcript_npc_preview" in transcript_indexes
+    finally:
+        await db.close()
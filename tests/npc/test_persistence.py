@@ -5,6 +5,10 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.schema import CreateTable
+
+from voiceover_mage.persistence.audio import store_audio
 from voiceover_mage.persistence.models import NPC, AudioTranscript, CharacterProfile, VoicePreview, WikiSnapshot
 
 
@@ -87,3 +91,29 @@ def test_audio_transcript_metadata():
     assert transcript.npc_id == 1
     assert transcript.preview_id == 2
     assert transcript.metadata_json["language"] == "en"
+
+
+def test_store_audio_is_content_addressed(tmp_path):
+    first = store_audio(b"clip", directory=tmp_path)
+    second = store_audio(b"clip", directory=tmp_path)
+
+    assert first == second
+    assert first.read_bytes() == b"clip"
+    assert [p.name for p in tmp_path.iterdir()] == [first.name]
+
+
+def test_json_columns_use_jsonb_on_postgresql():
+    json_columns = {
+        WikiSnapshot: ["raw_data_json"],
+        CharacterProfile: ["profile_json", "text_analysis_json", "visual_analysis_json"],
+        VoicePreview: ["generation_metadata"],
+        AudioTranscript: ["metadata_json"],
+    }
+
+    for model, columns in json_columns.items():
+        postgres_ddl = str(CreateTable(model.__table__).compile(dialect=postgresql.dialect()))  # type: ignore[attr-defined]
+        sqlite_ddl = str(CreateTable(model.__table__).compile(dialect=sqlite.dialect()))  # type: ignore[attr-defined]
+        for column in columns:
+            assert f"{column} JSONB" in postgres_ddl
+            assert f"{column} JSON" in sqlite_ddl
+            assert f"{column} JSONB" not in sqlite_ddl
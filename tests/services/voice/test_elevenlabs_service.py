@@ -4,7 +4,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from voiceover_mage.services.voice.elevenlabs import ElevenLabsVoiceService
+from voiceover_mage.services.voice.elevenlabs import ElevenLabsVoiceService, _decode_previews, _get_client
 
 
 @pytest.fixture
@@ -13,7 +13,9 @@ def mock_elevenlabs_sdk(monkeypatch):
     # Attach nested attribute text_to_voice.design
     fake_client.text_to_voice.design = MagicMock()
     monkeypatch.setattr("voiceover_mage.services.voice.elevenlabs.ElevenLabs", lambda *a, **k: fake_client)
-    return fake_client
+    _get_client.cache_clear()
+    yield fake_client
+    _get_client.cache_clear()
 
 
 @pytest.mark.asyncio
@@ -44,3 +46,35 @@ async def test_generate_preview_audio_success(mock_elevenlabs_sdk):
     _, kwargs = mock_elevenlabs_sdk.text_to_voice.design.call_args
     assert kwargs["voice_description"] == voice_desc
     assert kwargs.get("auto_generate_text") is True
+
+
+@pytest.mark.asyncio
+async def test_generate_preview_audio_many_preserves_order(mock_elevenlabs_sdk):
+    def design(**kwargs):
+        encoded = base64.b64encode(kwargs["voice_description"].encode()).decode("ascii")
+        return SimpleNamespace(previews=[SimpleNamespace(audio_base_64=encoded)])
+
+    mock_elevenlabs_sdk.text_to_voice.design.side_effect = design
+
+    service = ElevenLabsVoiceService(max_concurrency=2)
+    results = await service.generate_preview_audio_many([("one", "Hi."), ("two", "Hi."), ("three", "Hi.")])
+
+    assert results == [(b"one",), (b"two",), (b"three",)]
+    assert mock_elevenlabs_sdk.text_to_voice.design.call_count == 3
+
+
+def test_decode_previews_skips_and_logs_clips_without_audio(monkeypatch):
+    warning = MagicMock()
+    monkeypatch.setattr("voiceover_mage.services.voice.elevenlabs.logger.warning", warning)
+    encoded = base64.b64encode(b"audio").decode("ascii")
+    response = {"previews": [{"audio_base_64": encoded}, {"audio_base_64": None}, {"audio_base_64": 42}]}
+
+    assert _decode_previews(response) == (b"audio",)
+    assert warning.call_count == 2
+
+
+def test_decode_previews_raises_when_no_clip_has_audio(monkeypatch):
+    monkeypatch.setattr("voiceover_mage.services.voice.elevenlabs.logger.warning", MagicMock())
+
+    with pytest.raises(ValueError, match="No valid audio clips"):
+        _decode_previews(SimpleNamespace(previews=[SimpleNamespace(audio_base_64="")]))
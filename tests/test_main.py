@@ -23,10 +23,13 @@ async def test_main_command_help():
 
 
 @pytest.mark.asyncio
-async def test_main_with_logging_status():
+async def test_main_with_logging_status(tmp_path, monkeypatch):
     """Test that logging-status command works."""
     from asyncclick.testing import CliRunner
 
+    # Interactive logging writes to ./logs; keep it out of the checkout
+    monkeypatch.chdir(tmp_path)
+
     runner = CliRunner()
     result = await runner.invoke(main, ["logging-status"])
 
@@ -8,6 +8,7 @@ from rich.console import Console
 from rich.table import Table
 
 from voiceover_mage.utils.logging.enhanced_progress import (
+    STAGE_ORDER,
     EnhancedProgressReporter,
     PipelineDashboard,
     PipelineStage,
@@ -99,6 +100,46 @@ class TestPipelineDashboard:
         renderable = dashboard.create_renderable()
         assert renderable is not None
 
+    def test_get_renderable_reuses_panel_until_changed(self):
+        """Test that the live panel is rebuilt only after a dashboard change."""
+        console = Console()
+        dashboard = PipelineDashboard(console=console, npc_id=3105, npc_name="Wise Old Man", clock=lambda: 100.0)
+
+        panel = dashboard.get_renderable()
+        assert dashboard.get_renderable() is panel
+
+        dashboard.start_stage(PipelineStage.RAW_EXTRACTION)
+        assert dashboard.get_renderable() is not panel
+
+    def test_changes_notify_on_change(self):
+        """Test that every dashboard change calls the on_change hook."""
+        console = Console()
+        dashboard = PipelineDashboard(console=console, npc_id=3105, npc_name="Wise Old Man")
+        dashboard.on_change = Mock()
+
+        dashboard.start_stage(PipelineStage.RAW_EXTRACTION)
+        dashboard.update_stage_data(PipelineStage.RAW_EXTRACTION, {"markdown_chars": 10})
+        dashboard.skip_stage(PipelineStage.VOICE_GENERATION, "cached")
+
+        assert dashboard.on_change.call_count == 3
+
+    def test_stage_rows_reused_until_stage_changes(self):
+        """Test that unchanged stage rows are not re-rendered."""
+        console = Console()
+        dashboard = PipelineDashboard(console=console, npc_id=3105, npc_name="Wise Old Man")
+        dashboard.complete_stage(PipelineStage.INTELLIGENT_ANALYSIS, data={"personality_traits": ["wise"]})
+
+        position = STAGE_ORDER.index(PipelineStage.INTELLIGENT_ANALYSIS)
+
+        dashboard.create_renderable()
+        first_row = dashboard._row_cache[position][1]
+        dashboard.create_renderable()
+        assert dashboard._row_cache[position][1] is first_row
+
+        dashboard.update_stage_data(PipelineStage.INTELLIGENT_ANALYSIS, {"confidence": 0.9})
+        dashboard.create_renderable()
+        assert dashboard._row_cache[position][1] is not first_row
+
 
 class TestEnhancedProgressReporter:
     """Test the enhanced progress reporter for async operations."""
@@ -132,6 +173,10 @@ class TestEnhancedProgressReporter:
 
             assert result == "success"
             mock_live.assert_called_once()
+            get_renderable = mock_live.call_args.kwargs["get_renderable"]
+            assert get_renderable() is not None
+            # Each stage change redraws at once instead of waiting for a polling task
+            assert mock_live_instance.refresh.call_count == 2
 
     @pytest.mark.asyncio
     async def test_run_with_status(self):
@@ -0,0 +1,55 @@
+# ABOUTME: Tests for the logging decorators in the logging utils module
+# ABOUTME: Validates which call arguments log_api_call records as the URL
+
+import pytest
+from loguru import logger
+
+from voiceover_mage.utils.logging import config
+from voiceover_mage.utils.logging.utils import log_api_call
+
+
+@pytest.fixture
+def logged_urls(monkeypatch):
+    """Collect the ``url`` bound on each API call log record."""
+    monkeypatch.setattr(config, "_min_level_no", None)
+    urls = []
+    sink_id = logger.add(
+        lambda message: urls.append(message.record["extra"].get("url")),
+        filter=lambda record: "api_name" in record["extra"],
+        level="INFO",
+    )
+    yield urls
+    logger.remove(sink_id)
+
+
+class TestLogApiCall:
+    """Test URL capture in the API call decorator."""
+
+    @pytest.mark.asyncio
+    async def test_first_argument_is_logged_by_default(self, logged_urls):
+        """Test that the URL is taken from the first positional argument by default."""
+
+        @log_api_call("example")
+        async def fetch(url: str) -> str:
+            return url
+
+        await fetch("https://example.com/npc")
+        assert logged_urls == ["https://example.com/npc"]
+
+    @pytest.mark.asyncio
+    async def test_method_url_argument(self, logged_urls):
+        """Test that methods can point past ``self`` or at a keyword argument."""
+
+        class Client:
+            @log_api_call("example", url_arg=1)
+            async def fetch(self, url: str) -> str:
+                return url
+
+            @log_api_call("example", url_arg="url")
+            async def fetch_keyword(self, *, url: str) -> str:
+                return url
+
+        client = Client()
+        await client.fetch("https://example.com/a")
+        await client.fetch_keyword(url="https://example.com/b")
+        assert logged_urls == ["https://example.com/a", "https://example.com/b"]
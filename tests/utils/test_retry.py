@@ -1,6 +1,9 @@
 # ABOUTME: Tests for simplified LLM retry logic using tenacity
 # ABOUTME: Validates error handling, rate limiting, and retry configuration
 
+import asyncio
+import time
+
 import pytest
 
 from voiceover_mage.utils.retry import (
@@ -10,6 +13,8 @@ from voiceover_mage.utils.retry import (
     LLMQuotaExceededError,
     LLMRateLimitError,
     LLMTimeoutError,
+    _convert_exception,
+    _RateLimiter,
     configure_llm_retry,
     get_llm_retry_status,
     llm_retry,
@@ -36,6 +41,13 @@ class TestLLMAPIErrors:
         quota_error = LLMQuotaExceededError("Quota exhausted")
         assert str(quota_error) == "Quota exhausted"
 
+    def test_convert_exception_keeps_category_priority(self):
+        """Test that earlier categories win when a message matches several."""
+        assert isinstance(_convert_exception(Exception("Connection timeout")), LLMTimeoutError)
+        assert isinstance(_convert_exception(Exception("network error: quota")), LLMQuotaExceededError)
+        assert isinstance(_convert_exception(Exception("HTTP 429 timeout")), LLMRateLimitError)
+        assert type(_convert_exception(Exception("boom"))) is LLMAPIError
+
 
 class TestRetryConfiguration:
     """Test retry configuration functions."""
@@ -65,6 +77,36 @@ class TestRetryConfiguration:
         assert "failure_threshold" in status["circuit_breaker"]
 
 
+class TestRateLimiter:
+    """Test the shared LLM rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_are_spaced(self):
+        """Test that concurrent acquires still respect the minimum interval."""
+        limiter = _RateLimiter(calls_per_second=50.0)
+        start = time.monotonic()
+        released = []
+
+        async def claim():
+            await limiter.acquire()
+            released.append(time.monotonic() - start)
+
+        await asyncio.gather(claim(), claim(), claim())
+
+        # Each caller waits for its own slot, so the n-th release is at least n intervals in
+        assert all(elapsed >= 0.019 * index for index, elapsed in enumerate(sorted(released)))
+
+    def test_usable_from_separate_event_loops(self):
+        """Test that contended acquires work when each call runs in its own event loop."""
+        limiter = _RateLimiter(calls_per_second=100.0)
+
+        async def contend():
+            await asyncio.gather(limiter.acquire(), limiter.acquire(), limiter.acquire())
+
+        asyncio.run(contend())
+        asyncio.run(contend())
+
+
 class TestLLMRetryDecorator:
     """Test the LLM retry decorator functionality."""
 
@@ -125,6 +167,23 @@ class TestLLMRetryDecorator:
         assert result == "success"
         assert call_count == 3
 
+    @pytest.mark.asyncio
+    async def test_success_clears_circuit_breaker_failures(self):
+        """Test that a successful call resets the circuit breaker failure count."""
+        reset_circuit_breaker()
+        call_count = 0
+
+        @llm_retry(max_attempts=3, min_wait=0.01, max_wait=0.02, with_rate_limiting=False)
+        async def flaky_function():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 2:
+                raise LLMConnectionError("Connection failed")
+            return "success"
+
+        assert await flaky_function() == "success"
+        assert get_llm_retry_status()["circuit_breaker"]["failure_count"] == 0
+
     @pytest.mark.asyncio
     async def test_retry_with_unrecoverable_failure(self):
         """Test retry doesn't retry unrecoverable failures."""